@@ -0,0 +1 @@
+"""Couche données de l'application Assurance Mobile (sans dépendance Streamlit)."""
@@ -0,0 +1,98 @@
+"""Bitmaps par modalité pour le filtrage croisé du Dashboard.
+
+Chaque modalité codée (cf. ``classify``), chaque TYPEPC et chaque disposition est
+un ensemble de lignes stocké en bits (``np.packbits``, 1 bit par réponse). Combiner
+des filtres revient à des ET / OU sur ces tableaux d'octets, et compter une modalité
+à un popcount : aucun masque n'est recalculé sur le texte des réponses.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import CODE_SUFFIX, RULES, modalities
+from amv.kpi import NPS_SEGMENTS
+from amv.schema import DISPO_COL, TYPEPC_COL
+
+# Nombre de bits à 1 de chaque octet.
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+def popcount(bits: np.ndarray) -> int:
+    return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    bits = np.packbits(mask)
+    bits.setflags(write=False)
+    return bits
+
+
+def codes_of(question: str, labels) -> tuple[int, ...]:
+    """Codes correspondant à des libellés cliqués (notes, segments NPS pour Q16, modalités)."""
+    if question == "Q16":
+        return tuple(sorted(c for label in labels for c in NPS_SEGMENTS.get(label, ())))
+    if RULES[question].get("kind") == "score":
+        return tuple(sorted({int(label) for label in labels}))
+    names = modalities(question)
+    return tuple(sorted(names.index(label) for label in labels if label in names))
+
+
+@dataclass(frozen=True)
+class BitmapIndex:
+    n_rows: int
+    typepc: dict                              # TYPEPC -> bits
+    dispositions: dict[int, np.ndarray]       # code de disposition -> bits
+    questions: dict[str, tuple[np.ndarray, ...]]  # question -> bits de chaque modalité
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "BitmapIndex":
+        """Indexe un DataFrame classé ; les positions sont celles de ``df`` (trié par date)."""
+        t_codes, typepc = pd.factorize(df[TYPEPC_COL].astype(object))
+        d = df[DISPO_COL].to_numpy(np.int16, na_value=-1)
+        questions = {}
+        for q in RULES:
+            if q + CODE_SUFFIX in df.columns:
+                codes = df[q + CODE_SUFFIX].to_numpy()
+                questions[q] = tuple(_pack(codes == c) for c in range(len(modalities(q))))
+        return cls(n_rows=len(df),
+                   typepc={t: _pack(t_codes == i) for i, t in enumerate(typepc)},
+                   dispositions={int(v): _pack(d == v) for v in np.unique(d[d >= 0])},
+                   questions=questions)
+
+    def _empty(self) -> np.ndarray:
+        return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+
+    def _rows(self, rows: slice) -> np.ndarray:
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[rows] = True
+        return np.packbits(mask)
+
+    def _any(self, bitmaps) -> np.ndarray:
+        return reduce(np.bitwise_or, bitmaps, self._empty())
+
+    def select(self, rows: slice, typepc=None, dispositions=(), filters=None
+               ) -> tuple[int, dict[str, pd.Series]]:
+        """Même contrat que ``Cube.select``, avec en plus des filtres ``{question: codes}``.
+
+        Les effectifs d'une question filtrée ignorent son propre filtre : le graphique
+        cliqué garde toutes ses modalités, seuls les autres sont restreints.
+        """
+        base = self._rows(rows)
+        if typepc is not None:
+            base &= self.typepc.get(typepc, self._empty())
+        base &= self._any(self.dispositions[d] for d in dispositions if d in self.dispositions)
+        masks = {q: self._any(self.questions[q][c] for c in codes)
+                 for q, codes in (filters or {}).items()}
+        full = reduce(np.bitwise_and, masks.values(), base)
+        tallies = {}
+        for q, bitmaps in self.questions.items():
+            own = full if q not in masks else reduce(
+                np.bitwise_and, (m for k, m in masks.items() if k != q), base)
+            tallies[q] = pd.Series([popcount(own & b) for b in bitmaps],
+                                   index=pd.Index(modalities(q), name=q))
+        return popcount(full), tallies
@@ -0,0 +1,108 @@
+"""Classement des réponses libres en modalités codées, une seule fois au chargement.
+
+Chaque question est décrite dans ``RULES`` : une normalisation du texte, puis des
+modalités ordonnées avec leur motif (la première qui correspond l'emporte). Les
+règles ne s'appliquent qu'aux valeurs distinctes d'une colonne, puis les codes sont
+propagés aux lignes ; les KPI deviennent des ``bincount`` sur ces codes entiers.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+CODE_SUFFIX = "__code"
+UNCLASSIFIED = -1
+SCORES = tuple(range(11))
+
+RULES = {
+    "Q1":  {"kind": "score"},
+    "Q16": {"kind": "score"},
+    "Q15": {"normalize": "lower",
+            "modalities": [("Très simples", r"très simple"), ("Simples", r"simple"),
+                           ("Très compliquées", r"très compliqu"), ("Compliquées", r"compliqu")]},
+    "Q3":  {"normalize": "ascii",
+            "modalities": [("Très complètes", r"\btres completes\b"), ("Suffisantes", r"\bsuffisantes\b"),
+                           ("Insuffisantes", r"\binsuffisantes\b"),
+                           ("Nul", r"je nai pas eu dinformations sur ces sujets")]},
+    "Q6":  {"normalize": "lower",
+            "modalities": [("En boutique Orange", r"boutique orange"),
+                           ("Service client Orange", r"service client orange"),
+                           ("Contact Assurance Mobile", r"contact.*assurance mobile")]},
+    "Q5":  {"normalize": "lower",
+            "modalities": [("Parfaite", r"connaissais parfaitement"), ("Partielle", r"connaissance partielle"),
+                           ("Intéressé·e", r"intéressé"), ("Ignorance", r"ne connaissais pas|ignorais pas")]},
+    "Q7":  {"normalize": "lower", "modalities": [("Oui", r"\boui\b"), ("Non", r"\bnon\b")]},
+}
+# Questions oui/non affichées en camembert : les non-réponses y ont leur part.
+for _q in ("Q8", "Q9", "Q11", "Q13"):
+    RULES[_q] = {"normalize": "lower", "modalities": [("Oui", r"\boui\b"), ("Non", r"\bnon\b")],
+                 "other": "Autre", "missing": "Sans réponse"}
+
+
+def modalities(question: str) -> tuple[str, ...]:
+    """Libellés des modalités d'une question, dans l'ordre des codes."""
+    rule = RULES[question]
+    if rule.get("kind") == "score":
+        return SCORES
+    labels = [label for label, _ in rule["modalities"]]
+    labels += [rule[k] for k in ("other", "missing") if k in rule]
+    return tuple(labels)
+
+
+def codes_for(question: str, labels) -> list[int]:
+    """Codes (positions dans ``modalities``) des libellés ``labels`` d'une question."""
+    names = modalities(question)
+    return [names.index(label) for label in labels]
+
+
+def fold(text: str) -> str:
+    """Texte sans accents (décomposition NFKD, caractères non ASCII retirés), en minuscules."""
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+
+
+def _normalize(values: pd.Index, how: str) -> pd.Series:
+    s = pd.Series(values.astype(str))
+    if how == "ascii":
+        s = s.map(fold).str.replace("'", "", regex=False)  # « ’ » est déjà retiré par fold
+    return s.str.lower().str.strip()
+
+
+def classify_column(values: pd.Series, question: str) -> np.ndarray:
+    """Codes int8 d'une colonne (``UNCLASSIFIED`` quand aucune modalité ne s'applique)."""
+    rule = RULES[question]
+    if rule.get("kind") == "score":
+        scores = pd.to_numeric(values, errors="coerce")
+        valid = scores.notna() & scores.between(0, 10)
+        return np.where(valid, scores.fillna(UNCLASSIFIED), UNCLASSIFIED).astype(np.int8)
+
+    labels = modalities(question)
+    cat = values.astype("category")
+    texts = _normalize(cat.cat.categories, rule["normalize"])
+    # Dernière case de la table = valeurs manquantes (code catégoriel -1).
+    lut = np.full(len(texts) + 1, UNCLASSIFIED, dtype=np.int8)
+    for code, (_, pattern) in enumerate(rule["modalities"]):
+        hit = texts.str.contains(pattern, regex=True, na=False).to_numpy()
+        free = lut[:-1] == UNCLASSIFIED
+        lut[:-1][hit & free] = code
+    if "other" in rule:
+        lut[:-1][lut[:-1] == UNCLASSIFIED] = labels.index(rule["other"])
+    if "missing" in rule:
+        lut[-1] = labels.index(rule["missing"])
+    return lut[cat.cat.codes.to_numpy()]
+
+
+def classify(df: pd.DataFrame) -> pd.DataFrame:
+    """Ajoute une colonne de codes ``<question>__code`` par question de ``RULES``."""
+    codes = {q + CODE_SUFFIX: classify_column(df[q], q) for q in RULES if q in df.columns}
+    return df.assign(**codes)
+
+
+def tally(df: pd.DataFrame, question: str) -> pd.Series:
+    """Effectifs par modalité (toutes les modalités, même nulles)."""
+    labels = modalities(question)
+    codes = df[question + CODE_SUFFIX].to_numpy()
+    counts = np.bincount(codes[codes >= 0].astype(np.intp), minlength=len(labels))
+    return pd.Series(counts, index=pd.Index(labels, name=question))
@@ -0,0 +1,129 @@
+"""Cube d'effectifs pré-agrégés (jour × TYPEPC × disposition × question × modalité).
+
+Construit une fois par version des données ; les filtres du Dashboard se résolvent
+en sommant des tranches du cube, pour un coût proportionnel au nombre de cellules
+et non au nombre de réponses.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import CODE_SUFFIX, RULES, modalities
+from amv.schema import DATE_COL, DISPO_COL, TYPEPC_COL
+
+ALL_TYPEPC = "Tous"
+
+
+@dataclass(frozen=True)
+class Cube:
+    days: np.ndarray              # datetime64[D], triés
+    typepc: tuple                 # modalités TYPEPC (NaN inclus s'il existe)
+    dispositions: tuple[int, ...]
+    slots: dict[str, slice]       # question -> tranche sur le dernier axe
+    counts: np.ndarray            # (jours, typepc, dispositions, lignes + modalités)
+
+    def date_bounds(self, typepc=None) -> tuple[dt.date, dt.date] | None:
+        """Premier et dernier jour ayant au moins une réponse pour ce TYPEPC."""
+        rows = self.counts[..., 0]
+        if typepc is not None:
+            rows = rows[:, [self.typepc.index(typepc)]]
+        present = np.flatnonzero(rows.sum(axis=(1, 2)))
+        if not len(present):
+            return None
+        return self.days[present[0]].item(), self.days[present[-1]].item()
+
+    def select(self, start: dt.date, end: dt.date, typepc=None,
+               dispositions=None) -> tuple[int, dict[str, pd.Series]]:
+        """Nombre de réponses et effectifs par modalité pour un jeu de filtres."""
+        lo = np.searchsorted(self.days, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.days, np.datetime64(end, "D"), side="right")
+        block = self.counts[lo:hi]
+        if typepc is not None:
+            block = block[:, [self.typepc.index(typepc)]]
+        if dispositions is not None:
+            block = block[:, :, [i for i, d in enumerate(self.dispositions) if d in dispositions]]
+        totals = block.sum(axis=(0, 1, 2))
+        tallies = {q: pd.Series(totals[s], index=pd.Index(modalities(q), name=q))
+                   for q, s in self.slots.items()}
+        return int(totals[0]), tallies
+
+    def by_month(self, margins: bool = False) -> tuple[np.ndarray, list, np.ndarray]:
+        """Mois, TYPEPC et effectifs regroupés par mois (``np.add.reduceat`` sur l'axe des jours).
+
+        Avec ``margins``, un TYPEPC ``ALL_TYPEPC`` totalise tous les autres.
+        """
+        months = self.days.astype("datetime64[M]")
+        starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]]) if len(months) else np.array([], int)
+        counts = np.add.reduceat(self.counts, starts, axis=0) if len(starts) else self.counts[:0]
+        typepc = list(self.typepc)
+        if margins:
+            counts = np.concatenate([counts, counts.sum(axis=1, keepdims=True)], axis=1)
+            typepc.append(ALL_TYPEPC)
+        return months[starts], typepc, counts
+
+
+def build_cube(df: pd.DataFrame) -> Cube:
+    """Agrège un DataFrame classé (cf. ``classify``) ; les réponses sans date ou sans
+    disposition lisible sont exclues."""
+    day = df[DATE_COL].to_numpy().astype("datetime64[D]")
+    kept = ~np.isnat(day) & df[DISPO_COL].notna().to_numpy()
+    day = day[kept]
+    days = np.unique(day)
+    # Tri lexical (et non selon l'ordre des catégories) : des cubes partiels restent fusionnables.
+    t_codes, typepc = pd.factorize(df.loc[kept, TYPEPC_COL].astype(object), sort=True,
+                                   use_na_sentinel=False)
+    d_codes, dispositions = pd.factorize(df.loc[kept, DISPO_COL], sort=True)
+
+    slots, width = {}, 1  # case 0 : nombre de lignes
+    for q in RULES:
+        if q + CODE_SUFFIX in df.columns:
+            n = len(modalities(q))
+            slots[q] = slice(width, width + n)
+            width += n
+
+    shape = (len(days), len(typepc), len(dispositions))
+    cell = np.ravel_multi_index((np.searchsorted(days, day), t_codes, d_codes), shape)
+    n_cells = int(np.prod(shape))
+    counts = np.zeros((n_cells, width), dtype=np.int32)
+    counts[:, 0] = np.bincount(cell, minlength=n_cells)
+    for q, s in slots.items():
+        codes = df[q + CODE_SUFFIX].to_numpy()[kept]
+        ok = codes >= 0
+        n = s.stop - s.start
+        flat = np.bincount(cell[ok] * n + codes[ok], minlength=n_cells * n)
+        counts[:, s] = flat.reshape(n_cells, n)
+
+    return Cube(days=days, typepc=tuple(typepc), dispositions=tuple(int(d) for d in dispositions),
+                slots=slots, counts=counts.reshape(*shape, width))
+
+
+def _typepc_order(values) -> tuple:
+    values = list(values)
+    ordered = tuple(sorted({v for v in values if isinstance(v, str)}))
+    # Même convention que factorize(use_na_sentinel=False) : la valeur manquante en dernier.
+    return ordered + ((np.nan,) if any(pd.isna(v) for v in values) else ())
+
+
+def merge_cubes(cubes: list[Cube]) -> Cube:
+    """Somme de cubes partiels (par exemple un par bloc de lecture) sur l'union de leurs axes."""
+    if len(cubes) == 1:
+        return cubes[0]
+    days = np.unique(np.concatenate([c.days for c in cubes]))
+    typepc = _typepc_order(t for c in cubes for t in c.typepc)
+    dispositions = tuple(sorted({d for c in cubes for d in c.dispositions}))
+    slots = cubes[0].slots
+    counts = np.zeros((len(days), len(typepc), len(dispositions), cubes[0].counts.shape[-1]),
+                      dtype=np.int32)
+    for c in cubes:
+        if c.slots != slots:
+            raise ValueError("Cubes partiels construits avec des questions différentes")
+        t_pos = [next(i for i, t in enumerate(typepc) if t == v or (pd.isna(t) and pd.isna(v)))
+                 for v in c.typepc]
+        d_pos = [dispositions.index(d) for d in c.dispositions]
+        counts[np.ix_(np.searchsorted(days, c.days), t_pos, d_pos)] += c.counts
+    return Cube(days=days, typepc=typepc, dispositions=dispositions, slots=slots, counts=counts)
@@ -0,0 +1,60 @@
+"""Jeu de données canonique, en lecture seule, partagé par toutes les pages et sessions."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+import pandas as pd
+
+from amv.bitmaps import BitmapIndex
+from amv.classification import CODE_SUFFIX, classify
+from amv.cube import Cube, build_cube
+from amv.date_index import DateIndex, sort_by_date
+from amv.leaderboard import GroupIndex
+from amv.profiling import current
+from amv.schema import DISPO_COL
+
+PII_COLUMNS = ("Courriel", "NIP", "NCLI", "NPOL", "EMAIL", "CIV", "NOM", "NOMMAG")
+DISPOSITIONS = {1: "Complétés", 2: "Abandonnés", 0: "Interrompus"}
+
+
+def version_of(signature: tuple) -> str:
+    """Identifiant court d'une version des données, dérivé de l'empreinte des exports."""
+    return hashlib.sha1(repr(signature).encode()).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    version: str
+    df: pd.DataFrame        # trié par date, classé, sans données personnelles
+    dates: DateIndex
+    cube: Cube
+    bitmaps: BitmapIndex    # filtres croisés du Dashboard
+    groups: GroupIndex      # lignes de chaque point de service, marque et modèle
+
+    @property
+    def answer_columns(self) -> list[str]:
+        """Colonnes affichables (sans les codes de classement internes)."""
+        return [c for c in self.df.columns if not c.endswith(CODE_SUFFIX)]
+
+
+def build_dataset(raw: pd.DataFrame, version: str) -> Dataset:
+    """Prépare une fois pour toutes le jeu partagé : PII retirées, tri, classement, index, cube."""
+    prof = current()
+    with prof.stage("nettoyage"):
+        df = sort_by_date(raw.drop(columns=list(PII_COLUMNS), errors="ignore"))
+    with prof.stage("classement"):
+        df = classify(df)
+    labels = df[DISPO_COL].map(DISPOSITIONS).fillna("Autre").astype("category")
+    df = df.assign(disposition=labels)
+    with prof.stage("cube"):
+        cube = build_cube(df)
+    cube.counts.setflags(write=False)
+    with prof.stage("index des dates"):
+        dates = DateIndex.build(df)
+    with prof.stage("bitmaps"):
+        bitmaps = BitmapIndex.build(df)
+    with prof.stage("groupes"):
+        groups = GroupIndex.build(df)
+    return Dataset(version=version, df=df, dates=dates, cube=cube, bitmaps=bitmaps, groups=groups)
@@ -0,0 +1,81 @@
+"""Index de dates trié pour les filtres de période (recherche dichotomique, sans masque)."""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from amv.schema import DATE_COL, DISPO_COL
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Trie le jeu par date (stable, réponses sans date en fin) : préalable à ``DateIndex``."""
+    return df.sort_values(DATE_COL, kind="stable", na_position="last", ignore_index=True)
+
+
+def _freeze(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+@dataclass(frozen=True)
+class DateIndex:
+    dates: np.ndarray                       # datetime64[D], lignes datées seulement
+    by_code: dict[int, np.ndarray]          # disposition -> positions triées
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "DateIndex":
+        """Indexe un DataFrame déjà trié par ``sort_by_date``."""
+        dates = df[DATE_COL].to_numpy().astype("datetime64[D]")
+        n_dated = int((~np.isnat(dates)).sum())
+        codes = df[DISPO_COL].to_numpy(np.int16, na_value=-1)
+        order = np.argsort(codes, kind="stable")
+        values, starts = np.unique(codes[order], return_index=True)
+        by_code = {int(v): _freeze(p) for v, p in zip(values, np.split(order, starts[1:])) if v >= 0}
+        return cls(dates=_freeze(dates[:n_dated]), by_code=by_code)
+
+    def _positions(self, code: int | None) -> np.ndarray | None:
+        return None if code is None else self.by_code.get(code, np.empty(0, dtype=np.intp))
+
+    def bounds(self, code: int | None = None) -> tuple[dt.date, dt.date] | None:
+        """Première et dernière date connues (pour une disposition donnée le cas échéant)."""
+        pos = self._positions(code)
+        if pos is not None:
+            pos = pos[pos < len(self.dates)]
+            first, last = (pos[0], pos[-1]) if len(pos) else (None, None)
+        else:
+            first, last = (0, len(self.dates) - 1) if len(self.dates) else (None, None)
+        if first is None:
+            return None
+        return self.dates[first].item(), self.dates[last].item()
+
+    def span(self, start: dt.date, end: dt.date) -> slice:
+        """Tranche des lignes datées entre ``start`` et ``end`` inclus, en O(log n)."""
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        return slice(int(lo), int(hi))
+
+    def select(self, start: dt.date, end: dt.date, code: int | None = None) -> slice | np.ndarray:
+        """Lignes de la période, plus les interrompus (code 0) quelle que soit leur date.
+
+        Les interrompus sont en général sans date, donc en fin de jeu : si ce sont les
+        seules lignes de la fin et que la période va jusqu'au dernier jour (réglage par
+        défaut du curseur), le résultat est une seule tranche et ``iloc`` ne copie pas.
+        Sinon, les positions sont assemblées (tranche de la période et interrompus hors période).
+        """
+        s = self.span(start, end)
+        zero = self.by_code.get(0, np.empty(0, dtype=np.intp))
+        if code == 0:
+            return zero
+        if code is not None:
+            pos = self._positions(code)
+            return pos[np.searchsorted(pos, s.start):np.searchsorted(pos, s.stop)]
+        a, b = np.searchsorted(zero, s.start), np.searchsorted(zero, s.stop)
+        before, after = zero[:a], zero[b:]
+        # Interrompus hors période formant un bloc contigu juste après la tranche : on l'étend.
+        if not len(before) and (not len(after) or (after[0] == s.stop and after[-1] - after[0] == len(after) - 1)):
+            return slice(s.start, s.stop + len(after))
+        return np.concatenate([before, np.arange(s.start, s.stop), after])
@@ -0,0 +1,171 @@
+"""Graphiques Plotly du Dashboard, construits à partir des indicateurs de ``amv.kpi``."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+REPARTITION_Q1 = "Répartition de la satisfaction globale"
+REPARTITION_NPS = "Répartition NPS"
+
+
+def fig_repartition(ind: dict, choix: str = REPARTITION_Q1):
+    if choix == REPARTITION_Q1:
+        q1 = ind["q1"]
+        dist_q1 = (q1 / q1.sum() * 100).round(1).rename_axis("Q1").reset_index(name="pct")
+        fig = px.bar(dist_q1, x="Q1", y="pct", color="pct", color_continuous_scale="Viridis",
+                     labels={"pct": "% répondants"}, title="Répartition des notes Q1 (%)")
+    else:
+        pct_prom, pct_det = ind["pct_prom"], ind["pct_det"]
+        nps_df = pd.DataFrame({"Segment": ["Promoters", "Passives", "Detractors"],
+                               "Pourcentage": [pct_prom, 100 - (pct_prom + pct_det), pct_det]})
+        fig = px.bar(nps_df, x="Segment", y="Pourcentage", color="Pourcentage",
+                     color_continuous_scale="Viridis", labels={"Pourcentage": "% répondants"},
+                     title="Répartition NPS (%)")
+    fig.update_traces(texttemplate="%{y:.1f}%", textposition="outside")
+    return fig
+
+
+def _bar_pct(shares: pd.Series, x: str, title: str, texttemplate: str = "%{text:.1f} %"):
+    df = shares.rename_axis(x).reset_index(name="pct")
+    fig = px.bar(df, x=x, y="pct", text="pct",
+                 color=x, color_discrete_sequence=px.colors.qualitative.Pastel,
+                 labels={"pct": "% répondants"}, title=title)
+    fig.update_traces(texttemplate=texttemplate, textposition="outside")
+    return fig
+
+
+def fig_q15(ind: dict):
+    df_q15 = ind["q15"].rename_axis("Catégorie").reset_index(name="Pourcentage")
+    fig = px.bar(df_q15, x="Catégorie", y="Pourcentage", text="Pourcentage",
+                 color="Catégorie", color_discrete_sequence=px.colors.qualitative.Pastel,
+                 labels={"Pourcentage": "% répondants"},
+                 title="Q15. Démarches nécessaires à la gestion du sinistre")
+    fig.update_traces(texttemplate="%{text:.1f} %", textposition="outside")
+    return fig
+
+
+def fig_q3(ind: dict):
+    dist_q3 = ind["q3"].rename_axis("Catégorie").reset_index(name="Count")
+    dist_q3["pct"] = (dist_q3["Count"] / dist_q3["Count"].sum() * 100).round(1)
+    fig = px.bar(dist_q3, x="Catégorie", y="Count", text="pct",
+                 labels={"Count": "Nombre de réponses", "pct": "% répondants"},
+                 title="Q3. Explications du vendeur – Assurance Mobile",
+                 color="Catégorie", color_discrete_sequence=px.colors.qualitative.Pastel)
+    fig.update_traces(texttemplate="%{text:.1f}%", textposition="outside")
+    return fig
+
+
+def _share_of(counts: pd.Series) -> pd.Series:
+    return (counts / counts.sum() * 100).round(1)
+
+
+def fig_q6(ind: dict):
+    return _bar_pct(_share_of(ind["q6"]), "Catégorie", "Q6. Premier interlocuteur pour déclarer le sinistre")
+
+
+def fig_q5(ind: dict):
+    return _bar_pct(ind["q5"], "Modalité", "Q5. Niveau de connaissance des conditions de garantie")
+
+
+def fig_q7(ind: dict):
+    return _bar_pct(ind["q7"], "Modalité", "Q7. Cohérence des informations")
+
+
+def bar_oui_non(counts: pd.Series, title: str):
+    # En barres et non en camembert : Streamlit ne remonte pas la sélection d'une part.
+    return _bar_pct(_share_of(counts), "Modalité", title)
+
+
+def fig_trend(trend: pd.DataFrame, title: str):
+    """Évolution mensuelle d'un indicateur et bande de son intervalle de confiance."""
+    x = trend["mois"].astype(str)
+    band_x = pd.concat([x, x[::-1]])
+    band_y = pd.concat([trend["ic_haut"], trend["ic_bas"][::-1]])
+    fig = go.Figure([
+        go.Scatter(x=band_x, y=band_y, fill="toself", fillcolor="rgba(99,110,250,0.18)",
+                   line={"width": 0}, hoverinfo="skip", name="IC 95 %"),
+        go.Scatter(x=x, y=trend["valeur"], mode="lines+markers", name=title, line={"color": "#636EFA"},
+                   customdata=trend[["ic_bas", "ic_haut", "n"]].to_numpy(),
+                   hovertemplate="%{x} : %{y:.2f}<br>IC [%{customdata[0]:.2f} ; %{customdata[1]:.2f}]"
+                                 "<br>n = %{customdata[2]}<extra></extra>"),
+    ])
+    fig.update_layout(title=title, showlegend=False, xaxis_title="Mois", margin={"t": 50, "b": 10})
+    return fig
+
+
+TITLES_OUI_NON = {
+    "Q8": "Q8 – Satisfaction du délai global",
+    "Q13": "Q13 – Suivi du dossier",
+    "Q9": "Q9 – Satisfaction qualité réparation / mobile de remplacement",
+    "Q11": "Q11 – Réception du téléphone",
+}
+
+# Graphiques de chaque section, dans l'ordre d'affichage.
+SECTION_CHARTS = {
+    "global": {"repartition": fig_repartition, "q15": fig_q15},
+    "souscription": {"q3": fig_q3},
+    "declaration": {"q6": fig_q6, "q5": fig_q5, "q7": fig_q7},
+    "suivi": {q.lower(): (lambda ind, q=q: bar_oui_non(ind[q], TITLES_OUI_NON[q])) for q in ("Q8", "Q13")},
+    "reception": {q.lower(): (lambda ind, q=q: bar_oui_non(ind[q], TITLES_OUI_NON[q])) for q in ("Q9", "Q11")},
+}
+
+
+# Question filtrée par un clic sur chaque graphique (filtrage croisé).
+CHART_QUESTIONS = {"q15": "Q15", "q3": "Q3", "q6": "Q6", "q5": "Q5", "q7": "Q7",
+                   "q8": "Q8", "q13": "Q13", "q9": "Q9", "q11": "Q11"}
+
+
+def chart_question(cid: str, choix: str = REPARTITION_Q1) -> str:
+    """Question d'un graphique ; la répartition porte sur Q1 ou sur les segments NPS (Q16)."""
+    if cid == "repartition":
+        return "Q1" if choix == REPARTITION_Q1 else "Q16"
+    return CHART_QUESTIONS[cid]
+
+
+class FigureCache:
+    """Cache LRU de figures prêtes à émettre, borné en nombre d'entrées et en octets.
+
+    Clé conseillée : ``(version des données, filtres normalisés, identifiant du graphique)``.
+    Une figure déjà validée par Plotly ne coûte plus que sa sérialisation à chaque rerun,
+    au lieu de la construction ``px`` complète.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._entries: OrderedDict = OrderedDict()   # clé -> (figure, taille JSON)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key, build: Callable[[], go.Figure]) -> go.Figure:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        fig = build()
+        size = len(pio.to_json(fig, validate=False))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (fig, size)
+                self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return fig
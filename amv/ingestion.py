@@ -0,0 +1,69 @@
+"""Ingestion des exports AMV : détection d'encodage, lecture typée et lecture par blocs."""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+
+from amv.classification import classify
+from amv.cube import Cube, build_cube, merge_cubes
+from amv.schema import SCHEMA_VERSION, apply_schema, read_options
+
+# Du plus strict au plus permissif : latin-1 accepte n'importe quel octet.
+ENCODINGS = ("utf-8-sig", "cp1252", "latin-1")
+_BLOC = 1 << 20
+CHUNK_ROWS = 200_000
+
+
+def inspect_export(path: Path) -> dict:
+    """Empreinte (taille, mtime, sha1) et encodage de l'export, en une seule lecture."""
+    stat = path.stat()
+    sha1 = hashlib.sha1()
+    decoders = {enc: codecs.getincrementaldecoder(enc)() for enc in ENCODINGS}
+    with path.open("rb") as f:
+        while bloc := f.read(_BLOC):
+            sha1.update(bloc)
+            for enc, dec in list(decoders.items()):
+                try:
+                    dec.decode(bloc)
+                except UnicodeDecodeError:
+                    del decoders[enc]
+    for enc, dec in list(decoders.items()):
+        try:
+            dec.decode(b"", final=True)
+        except UnicodeDecodeError:
+            del decoders[enc]
+    encoding = next((enc for enc in ENCODINGS if enc in decoders), None)
+    if encoding is None:
+        raise ValueError(f"Aucun encodage parmi {ENCODINGS} ne décode {path.name}")
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "sha1": sha1.hexdigest(), "encoding": encoding, "schema": SCHEMA_VERSION}
+
+
+def read_export(path: Path, encoding: str) -> pd.DataFrame:
+    """Parse le CSV brut avec l'encodage déjà détecté, en ne gardant que les colonnes du schéma."""
+    return apply_schema(pd.read_csv(path, encoding=encoding, **read_options()))
+
+
+def stream_cube(path: Path, chunk_rows: int = CHUNK_ROWS) -> Cube:
+    """Cube de KPI d'un export lu par blocs : la mémoire dépend de ``chunk_rows``, pas du fichier.
+
+    Chaque bloc est décodé, validé, classé et pré-agrégé puis libéré ; seuls les cubes
+    partiels (une cellule par jour × TYPEPC × disposition) sont conservés et fusionnés.
+    Le résultat est identique à ``build_cube(classify(read_export(path, ...)))``
+    (vérifié par ``python -m benchmarks.check_stream``).
+    """
+    encoding = inspect_export(path)["encoding"]
+    partials = []
+    with pd.read_csv(path, encoding=encoding, chunksize=chunk_rows, **read_options()) as reader:
+        for chunk in reader:
+            partials.append(build_cube(classify(apply_schema(chunk))))
+            # Fusion au fil de l'eau : le nombre de cubes partiels reste borné.
+            if len(partials) >= 8:
+                partials = [merge_cubes(partials)]
+    if not partials:
+        raise ValueError(f"Export vide : {path.name}")
+    return merge_cubes(partials)
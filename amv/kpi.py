@@ -0,0 +1,89 @@
+"""Indicateurs du Dashboard, calculés section par section à partir des effectifs par modalité.
+
+Chaque fonction reçoit le nombre de complétés et les effectifs ``{question: Series}``
+renvoyés par ``Cube.select`` ; aucune ne relit les réponses elles-mêmes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# Segments NPS sur la note de recommandation Q16 (0–10).
+NPS_SEGMENTS = {"Promoters": (9, 10), "Passives": (7, 8), "Detractors": tuple(range(7))}
+
+
+def pct(n, total, digits: int | None = 1) -> float:
+    """Part de ``n`` dans ``total`` en %, 0 si ``total`` est nul ; ``digits=None`` : sans arrondi."""
+    if not total:
+        return 0.0
+    share = n / total * 100
+    return share if digits is None else round(share, digits)
+
+
+def ratio(num, den, scale: float = 1.0) -> np.ndarray:
+    """``pct`` sur des tableaux : ``num / den * scale``, NaN là où ``den`` est nul."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(den > 0, num / den * scale, np.nan)
+
+
+def _shares(counts: pd.Series) -> pd.Series:
+    total = counts.sum()
+    return counts.map(lambda n: pct(n, total))
+
+
+def global_indicators(n_comp: int, tallies: dict[str, pd.Series]) -> dict:
+    """Complétés, note moyenne Q1, NPS (Q16) et complexité des démarches (Q15)."""
+    q1 = tallies["Q1"][tallies["Q1"] > 0]
+    mean_q1 = float((q1.index * q1).sum() / q1.sum()) if q1.sum() else 0.0
+
+    nps = tallies["Q16"]
+    prom, passiv, detract = (nps.loc[list(NPS_SEGMENTS[s])].sum() for s in ("Promoters", "Passives", "Detractors"))
+    total_nps = prom + passiv + detract
+    pct_prom = pct(prom, total_nps, None)
+    pct_det = pct(detract, total_nps, None)
+
+    q15 = _shares(tallies["Q15"])
+    return {"n_comp": n_comp, "mean_q1": mean_q1, "q1": q1,
+            "pct_prom": pct_prom, "pct_det": pct_det, "nps_score": pct_prom - pct_det,
+            "q15": q15,
+            "pct_simples": q15["Très simples"] + q15["Simples"],
+            "pct_compliquees": q15["Très compliquées"] + q15["Compliquées"]}
+
+
+def souscription(n_comp: int, tallies: dict[str, pd.Series]) -> dict:
+    """Q3 : explications du vendeur, regroupées suffisantes / insuffisantes."""
+    q3 = tallies["Q3"]
+    total = q3.sum()
+    suff = q3["Très complètes"] + q3["Suffisantes"]
+    insuff = q3["Insuffisantes"] + q3["Nul"]
+    return {"q3": q3, "total_suff_compl": suff, "total_insuff_nil": insuff,
+            "pct_suff_compl": pct(suff, total, None),
+            "pct_insuff_nil": pct(insuff, total, None)}
+
+
+def declaration(n_comp: int, tallies: dict[str, pd.Series]) -> dict:
+    """Q6 (premier interlocuteur), Q5 (connaissance des garanties), Q7 (cohérence)."""
+    q6 = tallies["Q6"]
+    total_orange = q6["En boutique Orange"] + q6["Service client Orange"]
+    return {"q6": q6, "total_orange": total_orange, "pct_orange": pct(total_orange, q6.sum()),
+            "q5": _shares(tallies["Q5"]), "q7": _shares(tallies["Q7"])}
+
+
+def suivi_dossier(n_comp: int, tallies: dict[str, pd.Series]) -> dict:
+    """Q8 (délai global) et Q13 (suivi du dossier)."""
+    return {q: tallies[q][tallies[q] > 0] for q in ("Q8", "Q13")}
+
+
+def reception(n_comp: int, tallies: dict[str, pd.Series]) -> dict:
+    """Q9 (qualité réparation / remplacement) et Q11 (réception du téléphone)."""
+    return {q: tallies[q][tallies[q] > 0] for q in ("Q9", "Q11")}
+
+
+SECTIONS = {
+    "global": global_indicators,
+    "souscription": souscription,
+    "declaration": declaration,
+    "suivi": suivi_dossier,
+    "reception": reception,
+}
@@ -0,0 +1,99 @@
+"""Classement des points de service et des appareils, par agrégation groupée vectorisée.
+
+Les dimensions (CODEGDT, CODECFCA, MARQUE, MODELE) sont catégorielles : leurs codes entiers
+servent directement d'indices de groupe. Un ``np.bincount`` par question donne les
+effectifs de tous les groupes en une passe ; les indicateurs et le classement ne
+portent ensuite que sur une ligne par groupe, quel que soit le nombre de réponses.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import CODE_SUFFIX, codes_for, modalities
+from amv.kpi import NPS_SEGMENTS, ratio
+from amv.schema import DISPO_COL
+
+DIMENSIONS = {"CODEGDT": "Point de service (GDT)", "CODECFCA": "Point de service (CFCA)",
+              "MARQUE": "Marque", "MODELE": "Modèle"}
+# Indicateur -> (libellé, plus haut = meilleur, effectif de référence pour le seuil)
+METRICS = {
+    "nps": ("Score NPS", True, "n_nps"),
+    "note_moyenne_q1": ("Note moyenne Q1", True, "n_q1"),
+    "pct_compliquees_q15": ("Démarches compliquées Q15 (%)", False, "n_q15"),
+    "taux_completion": ("Taux de complétion (%)", True, "sollicites"),
+}
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    """Pour chaque dimension : code de groupe de chaque ligne et lignes de chaque groupe (CSR)."""
+    labels: dict[str, pd.Index]        # dimension -> libellés des groupes (ordre des codes)
+    codes: dict[str, np.ndarray]       # dimension -> code de groupe par ligne (-1 si manquant)
+    indptr: dict[str, np.ndarray]      # groupe g -> positions[indptr[g]:indptr[g + 1]]
+    positions: dict[str, np.ndarray]   # lignes triées par groupe, puis par position (donc par date)
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "GroupIndex":
+        labels, codes, indptr, positions = {}, {}, {}, {}
+        for dim in DIMENSIONS:
+            if dim not in df.columns:
+                continue
+            cat = df[dim].astype("category").cat
+            c = cat.codes.to_numpy()
+            order = np.argsort(c, kind="stable")
+            order = order[c[order] >= 0]
+            labels[dim], codes[dim], positions[dim] = cat.categories, c, order
+            indptr[dim] = np.concatenate([[0], np.cumsum(np.bincount(c[order], minlength=len(cat.categories)))])
+        for a in (*codes.values(), *indptr.values(), *positions.values()):
+            a.setflags(write=False)
+        return cls(labels=labels, codes=codes, indptr=indptr, positions=positions)
+
+    def rows(self, dim: str, label) -> np.ndarray:
+        """Positions (triées) des réponses d'un groupe."""
+        g = self.labels[dim].get_indexer([label])[0]
+        if g < 0:
+            return np.empty(0, dtype=np.intp)
+        return self.positions[dim][self.indptr[dim][g]:self.indptr[dim][g + 1]]
+
+
+def group_stats(df: pd.DataFrame, groups: GroupIndex, dim: str) -> pd.DataFrame:
+    """Effectifs et indicateurs de tous les groupes d'une dimension (complétés pour Q1, Q15, Q16)."""
+    g = groups.codes[dim]
+    n_groups = len(groups.labels[dim])
+    known = g >= 0
+    completes = known & (df[DISPO_COL].eq(1).to_numpy(bool, na_value=False))
+
+    def hist(question: str) -> np.ndarray:
+        k = len(modalities(question))
+        codes = df[question + CODE_SUFFIX].to_numpy()
+        ok = completes & (codes >= 0)
+        return np.bincount(g[ok].astype(np.intp) * k + codes[ok], minlength=n_groups * k).reshape(n_groups, k)
+
+    q1, q16, q15 = hist("Q1"), hist("Q16"), hist("Q15")
+    prom, det = (q16[:, codes_for("Q16", NPS_SEGMENTS[s])].sum(axis=1) for s in ("Promoters", "Detractors"))
+    solicited = np.bincount(g[known], minlength=n_groups)
+    n_comp = np.bincount(g[completes], minlength=n_groups)
+    compliquees = codes_for("Q15", ("Très compliquées", "Compliquées"))
+    stats = pd.DataFrame({
+        "sollicites": solicited,
+        "completes": n_comp,
+        "n_q1": q1.sum(axis=1),
+        "n_nps": q16.sum(axis=1),
+        "n_q15": q15.sum(axis=1),
+        "nps": ratio(prom - det, q16.sum(axis=1), 100),
+        "note_moyenne_q1": ratio(q1 @ np.array(modalities("Q1")), q1.sum(axis=1)),
+        "pct_compliquees_q15": ratio(q15[:, compliquees].sum(axis=1), q15.sum(axis=1), 100),
+        "taux_completion": ratio(n_comp, solicited, 100),
+    }, index=pd.Index(groups.labels[dim], name=dim))
+    return stats[stats["sollicites"] > 0]
+
+
+def rank(stats: pd.DataFrame, metric: str, min_n: int = 30) -> pd.DataFrame:
+    """Groupes ayant au moins ``min_n`` réponses pour l'indicateur, du meilleur au moins bon."""
+    _, higher_is_better, base = METRICS[metric]
+    ranked = stats[stats[base] >= min_n].sort_values(metric, ascending=not higher_is_better, kind="stable")
+    return ranked.assign(rang=np.arange(1, len(ranked) + 1)).round(2)
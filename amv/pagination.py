@@ -0,0 +1,50 @@
+"""Pagination côté serveur du détail des réponses : seule la page demandée est sérialisée."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def _text_match(s: pd.Series, query: str) -> np.ndarray:
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Recherche sur les modalités distinctes, puis report sur les lignes via les codes.
+        hit = s.cat.categories.astype(str).str.contains(query, case=False, regex=False)
+        codes = s.cat.codes.to_numpy()
+        return np.append(hit, False)[codes]
+    # Type « string » : les manquants restent <NA> (et non « NaT », « nan »…) et ne correspondent pas.
+    return s.astype("string").str.contains(query, case=False, regex=False, na=False).to_numpy(bool)
+
+
+def paginate(df: pd.DataFrame, columns: list[str] | None = None, sort_by: str | None = None,
+             ascending: bool = True, query: str = "", page: int = 1,
+             page_size: int = 50) -> tuple[pd.DataFrame, int, int]:
+    """Page ``page`` (à partir de 1) des lignes filtrées et triées.
+
+    Le filtre texte et le tri ne touchent que les colonnes concernées ; les lignes de la
+    page sont extraites en dernier. Renvoie ``(page, nombre de lignes retenues, nombre de pages)``.
+    """
+    columns = list(columns) if columns else list(df.columns)
+    positions = np.arange(len(df))
+    query = query.strip()
+    if query:
+        mask = np.zeros(len(df), dtype=bool)
+        for col in columns:
+            mask |= _text_match(df[col], query)
+        positions = positions[mask]
+
+    if sort_by is not None:
+        keys = df[sort_by].iloc[positions]
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            keys = keys.cat.reorder_categories(sorted(keys.cat.categories, key=str), ordered=True)
+        order = keys.reset_index(drop=True).sort_values(ascending=ascending, kind="stable",
+                                                        na_position="last").index.to_numpy()
+        positions = positions[order]
+
+    n_rows = len(positions)
+    n_pages = max(1, math.ceil(n_rows / page_size))
+    page = min(max(page, 1), n_pages)
+    chunk = positions[(page - 1) * page_size:page * page_size]
+    return df.iloc[chunk, df.columns.get_indexer(columns)], n_rows, n_pages
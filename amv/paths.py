@@ -0,0 +1,9 @@
+"""Emplacements des données du projet, partagés par l'application et la ligne de commande."""
+
+from pathlib import Path
+
+# Dossier racine du projet (celui de main.py)
+ROOT = Path(__file__).resolve().parent.parent
+
+RAW_DIR   = ROOT / "Donnee" / "1_raw"          # exports mensuels déposés tels quels
+STORE_DIR = ROOT / "Donnee" / "2_historique"   # historique partitionné par mois
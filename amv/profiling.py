@@ -0,0 +1,136 @@
+"""Instrumentation optionnelle des exécutions de page : durées par étape, caches, mémoire.
+
+Un ``Profiler`` est ouvert au début de chaque exécution du script (``start``) et reste
+accessible via ``current()`` depuis le même fil, y compris dans le corps des fonctions
+mises en cache. Désactivé, il ne mesure rien ; activé, il produit un enregistrement
+par exécution, affiché dans la barre latérale et ajouté à un journal JSON lines.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pandas n'est pas importé par la page d'accueil
+    import pandas as pd
+
+_local = threading.local()
+
+
+class Profiler:
+    def __init__(self, page: str, enabled: bool = True, session: str | None = None):
+        self.page = page
+        self.enabled = enabled
+        self.session = session
+        self.started = time.perf_counter()
+        self.stages: dict[str, list] = {}    # nom (chemin « a/b ») -> [secondes, appels]
+        self.caches: dict[str, list] = {}    # nom -> [appels, échecs]
+        self.frames: dict[str, float] = {}   # nom -> Mo (memory_usage(deep=True))
+        self._stack: list[str] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Chronomètre une étape ; les étapes imbriquées sont nommées « parent/enfant »."""
+        if not self.enabled:
+            yield
+            return
+        self._stack.append(name)
+        path = "/".join(self._stack)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(path, [0.0, 0])
+            entry[0] += time.perf_counter() - t0
+            entry[1] += 1
+            self._stack.pop()
+
+    def call(self, cache: str) -> None:
+        if self.enabled:
+            self.caches.setdefault(cache, [0, 0])[0] += 1
+
+    def miss(self, cache: str) -> None:
+        if self.enabled:
+            self.caches.setdefault(cache, [0, 0])[1] += 1
+
+    def lookup(self, cache: str, get, key, make):
+        """Consultation d'un cache « clé → fabrique » (``FigureCache.get``) avec comptage."""
+        def build():
+            self.miss(cache)
+            with self.stage(cache):
+                return make()
+        self.call(cache)
+        return get(key, build)
+
+    def frame(self, name: str, df: pd.DataFrame) -> None:
+        """Empreinte mémoire réelle d'un DataFrame (chaînes comprises)."""
+        if self.enabled:
+            self.frames[name] = df.memory_usage(deep=True).sum() / 2**20
+
+    def record(self) -> dict:
+        return {
+            "ts": dt.datetime.now().isoformat(timespec="seconds"),
+            "session": self.session,
+            "page": self.page,
+            "total_s": round(time.perf_counter() - self.started, 4),
+            "stages": {k: {"s": round(s, 4), "appels": n} for k, (s, n) in self.stages.items()},
+            "caches": {k: {"appels": n, "succes": n - m, "echecs": m} for k, (n, m) in self.caches.items()},
+            "memoire_mo": {k: round(v, 2) for k, v in self.frames.items()},
+        }
+
+    def write(self, path: Path) -> dict:
+        """Ajoute l'enregistrement de l'exécution au journal JSON lines."""
+        rec = self.record()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        return rec
+
+
+_DISABLED = Profiler("", enabled=False)
+
+
+def start(page: str, enabled: bool, session: str | None = None) -> Profiler:
+    """Ouvre le profiler de l'exécution en cours pour ce fil."""
+    _local.profiler = Profiler(page, enabled, session) if enabled else _DISABLED
+    return _local.profiler
+
+
+def current() -> Profiler:
+    return getattr(_local, "profiler", _DISABLED)
+
+
+def counted(cache_decorator):
+    """Applique un décorateur de cache Streamlit en comptant appels et échecs par fonction.
+
+        @counted(st.cache_data(max_entries=256))
+        def f(...): ...
+
+    Le corps n'est exécuté qu'en cas d'échec du cache : c'est lui qui signale l'échec.
+    """
+    def wrap(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)  # Streamlit calcule sa clé de cache sur le nom et la source de fn
+        def compute(*args, **kwargs):
+            current().miss(name)
+            return fn(*args, **kwargs)
+
+        cached = cache_decorator(compute)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            prof = current()
+            prof.call(name)
+            with prof.stage(name):
+                return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return wrap
@@ -0,0 +1,103 @@
+"""Moteur KPI hors Streamlit : grille mois × TYPEPC × disposition, en une passe vectorisée.
+
+Utilisation en ligne de commande ::
+
+    python -m amv.report rapports/kpi.csv            # historique Donnee/2_historique
+    python -m amv.report rapports/kpi.html --flux    # lecture par blocs des exports bruts
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import classify, codes_for, modalities
+from amv.cube import Cube, build_cube, merge_cubes
+from amv.ingestion import CHUNK_ROWS, stream_cube
+from amv.kpi import NPS_SEGMENTS, ratio
+from amv.paths import RAW_DIR, STORE_DIR
+from amv.store import load_store, raw_exports, update_store
+
+FORMATS = (".csv", ".parquet", ".html")
+
+
+def kpi_grid(cube: Cube, margins: bool = True) -> pd.DataFrame:
+    """KPI mensuels pour chaque TYPEPC et chaque disposition (plus « Tous » si ``margins``).
+
+    Les jours du cube sont regroupés par mois avec ``np.add.reduceat`` ; tous les
+    indicateurs sont ensuite calculés d'un bloc sur la matrice des effectifs.
+    """
+    months, typepc, counts = cube.by_month(margins)
+    index = pd.MultiIndex.from_product(
+        [pd.PeriodIndex(months, freq="M"), typepc, cube.dispositions],
+        names=["mois", "TYPEPC", "Codededisposition"])
+    flat = counts.reshape(-1, counts.shape[-1])
+    part = {q: flat[:, s] for q, s in cube.slots.items()}
+
+    def share(question: str, labels) -> np.ndarray:
+        q = part[question]
+        return ratio(q[:, codes_for(question, labels)].sum(1), q.sum(1), 100)
+
+    q1, q16 = part["Q1"], part["Q16"]
+    prom, det = (q16[:, codes_for("Q16", NPS_SEGMENTS[s])].sum(1) for s in ("Promoters", "Detractors"))
+    grid = pd.DataFrame({
+        "reponses": flat[:, 0],
+        "note_moyenne_q1": ratio(q1 @ np.array(modalities("Q1")), q1.sum(1)),
+        "nps": ratio(prom - det, q16.sum(1), 100),
+        "pct_simples_q15": share("Q15", ("Très simples", "Simples")),
+        "pct_compliquees_q15": share("Q15", ("Très compliquées", "Compliquées")),
+        "pct_suffisantes_q3": share("Q3", ("Très complètes", "Suffisantes")),
+        "pct_orange_q6": share("Q6", ("En boutique Orange", "Service client Orange")),
+    }, index=index)
+    return grid[grid["reponses"] > 0].round(2).reset_index()
+
+
+def write_grid(grid: pd.DataFrame, out: Path) -> None:
+    """Écrit la grille au format déduit de l'extension (.csv, .parquet ou .html)."""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    grid = grid.assign(mois=grid["mois"].astype(str))
+    if out.suffix == ".csv":
+        grid.to_csv(out, sep=";", index=False, encoding="utf-8-sig")
+    elif out.suffix == ".parquet":
+        grid.to_parquet(out, index=False)
+    elif out.suffix == ".html":
+        out.write_text(grid.to_html(index=False, na_rep="–", float_format="{:.1f}".format), encoding="utf-8")
+    else:
+        raise ValueError(f"Format de sortie non géré : {out.suffix} ({', '.join(FORMATS)})")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m amv.report", description=__doc__.splitlines()[0])
+    parser.add_argument("sortie", type=Path, help="fichier de sortie (.csv, .parquet ou .html)")
+    parser.add_argument("--raw", type=Path, default=RAW_DIR, help="dossier des exports bruts")
+    parser.add_argument("--store", type=Path, default=STORE_DIR, help="dossier de l'historique")
+    parser.add_argument("--flux", action="store_true",
+                        help="agréger les exports bloc par bloc, sans historique ni dédoublonnage")
+    parser.add_argument("--bloc", type=int, default=CHUNK_ROWS, help="lignes par bloc en mode --flux")
+    parser.add_argument("--sans-marges", action="store_true", help="ne pas ajouter TYPEPC « Tous »")
+    args = parser.parse_args(argv)
+    if args.sortie.suffix not in FORMATS:
+        parser.error(f"format de sortie non géré : {args.sortie.suffix or '(sans extension)'} "
+                     f"({', '.join(FORMATS)})")
+
+    if args.flux:
+        exports = raw_exports(args.raw)
+        if not exports:
+            parser.error(f"aucun export CSV dans {args.raw}")
+        cube = merge_cubes([stream_cube(p, args.bloc) for p in exports])
+    else:
+        update_store(args.raw, args.store)
+        cube = build_cube(classify(load_store(args.store)))
+
+    grid = kpi_grid(cube, margins=not args.sans_marges)
+    write_grid(grid, args.sortie)
+    print(f"{len(grid)} lignes écrites dans {args.sortie}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Schéma déclaré de l'export AMV : colonnes utiles aux pages et types compacts.
+
+Seules ces colonnes sont lues ; les données personnelles (courriels, NOM, NCLI, NPOL,
+NIP, CIV, NOMMAG), les URL de sondage et la géolocalisation ne sont jamais chargées.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+DATE_COL = "Datedeladernièreconnexion"
+# Date de sollicitation (JJ/MM/AAAA), renseignée aussi pour les réponses interrompues.
+SOLICIT_COL = "DATEC"
+DISPO_COL = "Codededisposition"
+TYPEPC_COL = "TYPEPC"
+SEP = ";"
+# À incrémenter à chaque modification de SCHEMA : invalide l'historique.
+SCHEMA_VERSION = 2
+
+_TEXT = "object"
+SCHEMA = {
+    "IDdefiche": "int64",
+    DATE_COL: "datetime64[ns]",
+    SOLICIT_COL: "datetime64[ns]",
+    DISPO_COL: "Int8",
+    "Appareil": "category",
+    "Navigateur": "category",
+    TYPEPC_COL: "category",
+    "TYPEPC2": "category",
+    "MARQUE": "category",
+    "MODELE": "category",
+    "CODEGDT": "category",
+    "CODECFCA": "category",
+    "TYPESI": "category",
+    "LIB_CHARGE": "category",
+    "Q1": "Int8",
+    "Q2": _TEXT,
+    **{q: "category" for q in ("Q3", "Q4", "Q5", "Q6", "Q7", "Q8", "Q9", "Q10", "Q11",
+                               "Q13", "Q14", "Q15", "Q17")},
+    "O_Q10": _TEXT,
+    "Q12": _TEXT,
+    "Q16": "Int8",
+}
+# Codes et notes lus comme texte puis convertis : une valeur hors barème (« NSP »…)
+# devient manquante au lieu d'interrompre la lecture de tout l'export.
+_NUMERIC = tuple(c for c, t in SCHEMA.items() if t == "Int8")
+REQUIRED = ("IDdefiche", DATE_COL, DISPO_COL, TYPEPC_COL)
+
+
+def read_options() -> dict:
+    """Arguments ``pd.read_csv`` pour une lecture projetée et typée."""
+    dtypes = {c: "category" if c in _NUMERIC else t for c, t in SCHEMA.items()
+              if c not in (DATE_COL, SOLICIT_COL)}
+    return {"sep": SEP, "usecols": lambda c: c in SCHEMA, "dtype": dtypes, "parse_dates": [DATE_COL]}
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Vérifie les colonnes obligatoires et ramène les colonnes présentes aux types déclarés."""
+    missing = [c for c in REQUIRED if c not in df.columns]
+    if missing:
+        raise ValueError(f"Colonnes obligatoires absentes de l'export : {', '.join(missing)}")
+    casts = {c: t for c, t in SCHEMA.items() if c in df.columns and str(df[c].dtype) != t}
+    if casts.get(DATE_COL):
+        df = df.assign(**{DATE_COL: pd.to_datetime(df[DATE_COL], errors="coerce")})
+        del casts[DATE_COL]
+    if casts.pop(SOLICIT_COL, None):
+        df = df.assign(**{SOLICIT_COL: pd.to_datetime(df[SOLICIT_COL], format="%d/%m/%Y", errors="coerce")})
+    numeric = {}
+    for c in _NUMERIC:
+        if casts.pop(c, None):
+            values = pd.to_numeric(df[c], errors="coerce")
+            numeric[c] = values.where((values.abs() <= 127) & (values % 1 == 0)).astype("Int8")
+    if numeric:
+        df = df.assign(**numeric)
+    return df.astype(casts) if casts else df
+
+
+def memory_report(path: Path, encoding: str) -> dict:
+    """Mémoire résidente (octets) de l'export lu en entier puis selon le schéma."""
+    full = pd.read_csv(path, sep=SEP, encoding=encoding, parse_dates=[DATE_COL])
+    projected = apply_schema(pd.read_csv(path, encoding=encoding, **read_options()))
+    before = int(full.memory_usage(deep=True).sum())
+    after = int(projected.memory_usage(deep=True).sum())
+    return {"columns_before": full.shape[1], "columns_after": projected.shape[1],
+            "bytes_before": before, "bytes_after": after, "saved": 1 - after / before}
+
+
+if __name__ == "__main__":
+    from amv.ingestion import inspect_export
+
+    for arg in sys.argv[1:]:
+        r = memory_report(Path(arg), inspect_export(Path(arg))["encoding"])
+        print(f"{arg} : {r['columns_before']} → {r['columns_after']} colonnes, "
+              f"{r['bytes_before'] / 1e6:.1f} → {r['bytes_after'] / 1e6:.1f} Mo "
+              f"({r['saved']:.0%} économisés)")
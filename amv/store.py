@@ -0,0 +1,161 @@
+"""Historique multi-mois des exports AMV, partitionné par mois et dédoublonné sur IDdefiche.
+
+Une réponse présente dans plusieurs exports est prise dans le plus récent, au sens de
+ses données (dernière date DATEC ou de connexion qu'il contient) et non de la date du
+fichier, que clone ou déploiement remettent à l'heure courante. À égalité, le dernier
+ingéré l'emporte ; les exports sont parcourus par nom.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from amv.ingestion import inspect_export, read_export
+from amv.schema import DATE_COL, SCHEMA_VERSION, SOLICIT_COL, apply_schema
+
+ID_COL = "IDdefiche"
+NO_DATE = "sans-date"
+_MANIFEST = "manifest.json"
+_INDEX = "index.parquet"
+_PARTITIONS = "partitions"
+# À incrémenter quand le partitionnement ou l'ordre des exports change : reconstruit l'historique.
+STORE_FORMAT = 2
+
+
+def raw_exports(raw_dir: Path) -> list[Path]:
+    """Exports CSV présents dans le dossier brut, par nom."""
+    return sorted(raw_dir.glob("*.csv"), key=lambda p: p.name)
+
+
+def raw_signature(raw_dir: Path) -> tuple:
+    """Signature bon marché (nom, taille, mtime) des exports, pour invalider les caches."""
+    return tuple((p.name, p.stat().st_size, p.stat().st_mtime_ns) for p in raw_exports(raw_dir))
+
+
+def _dates(df: pd.DataFrame) -> pd.Series:
+    """Date de sollicitation, à défaut de connexion : les interrompus en ont une aussi."""
+    return df[SOLICIT_COL].fillna(df[DATE_COL]) if SOLICIT_COL in df.columns else df[DATE_COL]
+
+
+def _month(df: pd.DataFrame) -> pd.Series:
+    return _dates(df).dt.strftime("%Y-%m").fillna(NO_DATE)
+
+
+def export_order(df: pd.DataFrame) -> int:
+    """Rang d'un export : sa date la plus récente (ns), connexion ou sollicitation."""
+    latest = max(df[DATE_COL].max(), _dates(df).max())
+    return 0 if pd.isna(latest) else int(latest.value)
+
+
+def _partition_path(store_dir: Path, mois: str) -> Path:
+    return store_dir / _PARTITIONS / f"mois={mois}.parquet"
+
+
+def _atomic_write(table: pa.Table, path: Path) -> None:
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp)
+    tmp.replace(path)
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    # Une colonne texte peut être lue en nombres dans un export et en texte dans un autre.
+    df = df.copy()
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _read_manifest(store_dir: Path) -> dict:
+    path = store_dir / _MANIFEST
+    manifest = json.loads(path.read_text()) if path.exists() else {}
+    if (manifest.get("schema"), manifest.get("format")) != (SCHEMA_VERSION, STORE_FORMAT):
+        # Historique écrit avec un autre schéma : on le reconstruit depuis les exports bruts.
+        shutil.rmtree(store_dir / _PARTITIONS, ignore_errors=True)
+        (store_dir / _INDEX).unlink(missing_ok=True)
+        manifest = {"schema": SCHEMA_VERSION, "format": STORE_FORMAT, "exports": {}}
+    return manifest
+
+
+def _read_index(store_dir: Path) -> pd.DataFrame:
+    path = store_dir / _INDEX
+    if path.exists():
+        return pq.read_table(path).to_pandas()
+    return pd.DataFrame({ID_COL: pd.Series(dtype="int64"), "mois": pd.Series(dtype="object"),
+                         "ordre": pd.Series(dtype="int64")})
+
+
+def _ingest(df: pd.DataFrame, ordre: int, index: pd.DataFrame, store_dir: Path) -> pd.DataFrame:
+    """Fusionne un export dans les partitions concernées ; renvoie l'index mis à jour."""
+    df = df.drop_duplicates(ID_COL, keep="last")
+    known = index[index[ID_COL].isin(df[ID_COL])]
+    # Un export plus récent déjà ingéré garde la main sur ses lignes.
+    df = df[~df[ID_COL].isin(known.loc[known["ordre"] > ordre, ID_COL])]
+    replaced = known[known["ordre"] <= ordre]
+    mois = _month(df)
+
+    for part in sorted(set(replaced["mois"]) | set(mois)):
+        path = _partition_path(store_dir, part)
+        frames = []
+        if path.exists():
+            old = pq.read_table(path).to_pandas()
+            frames.append(old[~old[ID_COL].isin(replaced[ID_COL])])
+        frames.append(df[mois == part])
+        frames = [f for f in frames if len(f)]
+        if frames:
+            _atomic_write(_to_table(apply_schema(pd.concat(frames, ignore_index=True))), path)
+        else:
+            path.unlink(missing_ok=True)
+
+    added = pd.DataFrame({ID_COL: df[ID_COL].to_numpy(), "mois": mois.to_numpy(), "ordre": ordre})
+    kept = index[~index[ID_COL].isin(added[ID_COL])]
+    return pd.concat([kept, added], ignore_index=True)
+
+
+def update_store(raw_dir: Path, store_dir: Path) -> list[str]:
+    """Ingère les exports jamais vus du dossier brut ; renvoie leurs noms."""
+    store_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(store_dir)
+    (store_dir / _PARTITIONS).mkdir(exist_ok=True)
+    seen = {e["sha1"] for e in manifest["exports"].values()}
+    index = None
+    ingested = []
+    for path in raw_exports(raw_dir):
+        stat = path.stat()
+        entry = manifest["exports"].get(path.name)
+        if entry and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            continue
+        info = inspect_export(path)
+        if info["sha1"] not in seen:
+            if index is None:
+                index = _read_index(store_dir)
+            df = read_export(path, info["encoding"])
+            info["ordre"] = export_order(df)
+            index = _ingest(df, info["ordre"], index, store_dir)
+            seen.add(info["sha1"])
+            ingested.append(path.name)
+        else:
+            # Contenu déjà ingéré (copie, nouveau mtime) : même rang.
+            info["ordre"] = next(e["ordre"] for e in manifest["exports"].values() if e["sha1"] == info["sha1"])
+        manifest["exports"][path.name] = info
+
+    if index is not None:
+        _atomic_write(pa.Table.from_pandas(index, preserve_index=False), store_dir / _INDEX)
+    tmp = store_dir / (_MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    tmp.replace(store_dir / _MANIFEST)
+    return ingested
+
+
+def load_store(store_dir: Path) -> pd.DataFrame:
+    """Relit tout l'historique, partitions mappées en mémoire."""
+    paths = sorted((store_dir / _PARTITIONS).glob("mois=*.parquet"))
+    if not paths:
+        raise FileNotFoundError(f"Aucune partition dans {store_dir}")
+    tables = [pq.read_table(p, memory_map=True) for p in paths]
+    return apply_schema(pa.concat_tables(tables, promote_options="default").to_pandas())
@@ -0,0 +1,191 @@
+"""Générateur d'exports AMV synthétiques, au format du fichier réel, de 10 k à plusieurs millions de lignes.
+
+Même en-tête (69 colonnes), séparateur ``;``, encodage latin-1, réponses entre triples
+guillemets (``\"\"\"Remplacement\"\"\"``), distributions des réponses Q1–Q17 calquées sur
+l'export d'origine, date de dernière connexion absente pour les interrompus (code 0),
+date de sollicitation (DATEC) pour toutes les lignes.
+L'écriture se fait par blocs : la mémoire ne dépend pas du nombre de lignes demandé.
+
+    python -m amv.synth bench.csv --lignes 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from amv.schema import DATE_COL, SEP
+
+ENCODING = "latin-1"
+CHUNK_ROWS = 250_000
+# À incrémenter quand le contenu généré change (colonnes, distributions) : invalide les
+# exports mis en cache par le banc de performance.
+GENERATOR_VERSION = 2
+
+COLUMNS = (
+    "IDdefiche", "Courriel", "Composeurmanuel", "Fuseauhoraire", "NIP", "Nomdusondage", "Langue",
+    "IDdupanéliste", DATE_COL, "Datederappel", "Semainedeladernièreconnexion",
+    "Heurededébutdeladernièreconnexion", "Duréedelaconnexionensecondes", "Duréedelaconnexionenminutes",
+    "Dernièrequestionremplie", "Nombredeconnexions", "Codededisposition", "DuréeTotale(sec.)", "Appareil",
+    "Systèmed'exploitation", "Versiondusystèmed'exploitation", "Navigateur", "Versiondunavigateur",
+    "Géolocalisation", "UtilisateurOffline", "Datederendez-vous", "URLduliendusondage",
+    "Dated'expirationdel'accès", "NCLI", "NPOL", "EMAIL", "CIV", "TYPEAP", "TYPEPC", "TYPEPC2", "NOM",
+    "MARQUE", "MODELE", "CODEGDT", "CODECFCA", "NOMMAG", "DATEO", "DATEC", "CP", "LIB_CHARGE", "VAGUE",
+    "TYPESI", "DATEEC", "Q1", "Q2", "Q3", "Q4", "Q5", "Q6", "Q7", "Q8", "LABEL0", "Q9", "LABEL1", "Q10",
+    "O_Q10", "Q11", "LABEL2", "Q12", "Q13", "Q14", "Q15", "Q16", "Q17",
+)
+
+
+def _q(text: str) -> str:
+    # Les réponses fermées de l'export sont elles-mêmes entre guillemets.
+    return f'"{text}"'
+
+
+# Effectifs observés dans l'export d'origine (complétés), utilisés comme poids.
+ANSWERS = {
+    "Q1": {"10": 412, "9": 168, "8": 146, "7": 64, "6": 19, "5": 50, "4": 8, "3": 4, "2": 7, "1": 7, "0": 9},
+    "Q3": {_q("Très complètes"): 421, _q("Suffisantes"): 313, _q("Insuffisantes"): 60,
+           _q("Je n'ai pas eu d'informations sur ces sujets"): 26},
+    "Q4": {_q("Oui"): 767, _q("Non"): 48},
+    "Q5": {_q("J'avais une connaissance partielle des garanties"): 326,
+           _q("Je m'y suis intéressé(e) au moment de ma déclaration"): 225,
+           _q("Je connaissais parfaitement les garanties"): 211,
+           _q("Je ne connaissais pas les garanties au moment de ma déclaration"): 48},
+    "Q6": {_q("Je suis allé(e) en boutique Orange"): 570, _q("J'ai contacté directement Assurance Mobile"): 193,
+           _q("J'ai appelé le service client Orange"): 44},
+    "Q7": {_q("Oui"): 577, _q("Non"): 38, "": 171},
+    "Q8": {_q("Oui"): 724, _q("Non"): 79},
+    "Q9": {_q("Oui"): 735, _q("Non"): 66},
+    "Q11": {_q("Oui"): 732, _q("Non"): 64},
+    "Q13": {_q("Oui"): 753, _q("Non"): 41},
+    "Q14": {_q("Par mail -courrier"): 613, _q("Par mail - courrier et par SMS"): 97, _q("Par SMS"): 48,
+            _q("Je n'ai pas toujours ou jamais reçu d'informations"): 30},
+    "Q15": {_q("Simples"): 405, _q("Très simples"): 291, _q("Compliquées"): 81, _q("Très compliquées"): 13},
+    "Q16": {"10": 312, "9": 134, "8": 150, "7": 70, "6": 33, "5": 74, "4": 1, "3": 2, "2": 3, "1": 2, "0": 5},
+    "Q17": {_q("Oui, j'accepte que mes réponses soient nominatives"): 411,
+            _q("Non, je souhaite conserver l'anonymat"): 375},
+}
+# Ordre du questionnaire : un abandon (code 2) s'arrête quelque part dans cette liste.
+QUESTION_ORDER = ("Q1", "Q2", "Q3", "Q4", "Q5", "Q6", "Q7", "Q8", "Q9", "Q11", "Q13", "Q14", "Q15", "Q16", "Q17")
+DISPOSITIONS = {0: 1484, 1: 786, 2: 162}
+BRANDS = {
+    "SAMSUNG": ["GALAXY Z FLIP5", "GALAXY S23 ULTR", "GALAXY A54 5G", "GALAXY S10 NOIR"],
+    "APPLE": ["IPHONE 15 128GO", "IPHONE 13 128GO", "IPHONE 11 64GO", "IPHONE 15 PROMA"],
+    "XIAOMI": ["REDMI NOTE 13", "XIAOMI 13T"], "CADAOZ RECONDIT": ["IPHONE 12 RECO"],
+    "RECOMMERCE RECO": ["IPHONE 11 RECO"], "LARGO RECONDITI": ["GALAXY S21 RECO"], "HONOR": ["HONOR 90"],
+    "GOOGLE": ["PIXEL 8"], "OPPO": ["FIND X5"], "CROSSCALL": ["CORE-Z5"],
+}
+BRAND_WEIGHTS = {"SAMSUNG": 937, "APPLE": 751, "XIAOMI": 197, "CADAOZ RECONDIT": 163, "RECOMMERCE RECO": 79,
+                 "LARGO RECONDITI": 74, "HONOR": 70, "GOOGLE": 43, "OPPO": 41, "CROSSCALL": 12}
+SINISTRES = {"CASSE": 1986, "VOL": 163, "OXYDATION": 160, "PERTE": 123}
+VERBATIM_DEBUT = ("Très bon dialogue", "Rapide et efficace", "Prise en charge rapide", "Service client à l'écoute",
+                  "Réparation rapide", "Délai trop long", "Bon accueil en boutique", "Déçu du service",
+                  "Personnel aimable", "Aucun souci")
+VERBATIM_FIN = ("", ", merci", " mais le téléphone a été livré en retard", ", je recommande",
+                " malgré plusieurs relances", " et la batterie tient moins la charge", ", rien à redire",
+                " mais il a fallu rappeler plusieurs fois")
+
+
+def _pick(rng: np.random.Generator, weights: dict, n: int) -> np.ndarray:
+    values = np.array(list(weights), dtype=object)
+    p = np.array(list(weights.values()), dtype=float)
+    return values[rng.choice(len(values), size=n, p=p / p.sum())]
+
+
+def generate(n_rows: int, seed: int = 0, start: str = "2025-01-01", months: int = 12,
+             n_stores: int | None = None, first_id: int = 1) -> pd.DataFrame:
+    """``n_rows`` réponses synthétiques (toutes colonnes en texte, prêtes à écrire)."""
+    rng = np.random.default_rng(seed)
+    n_stores = n_stores or int(min(3000, max(50, n_rows // 300)))
+    ids = np.arange(first_id, first_id + n_rows)
+    dispo = _pick(rng, DISPOSITIONS, n_rows).astype(int)
+
+    day0 = np.datetime64(start, "D")
+    span = int(((day0.astype("datetime64[M]") + months).astype("datetime64[D]") - day0).astype(int))
+    days = day0 + rng.integers(0, span, n_rows).astype("timedelta64[D]")
+    dates = pd.Series(pd.DatetimeIndex(days).strftime("%Y%m%d"), dtype=object)
+    dates[dispo == 0] = ""
+    # Sollicitation 1 à 58 jours avant la connexion, pour toutes les lignes (interrompus compris).
+    solicited = days - rng.integers(1, 59, n_rows).astype("timedelta64[D]")
+
+    remplacement = rng.random(n_rows) < 843 / 2432
+    typepc2 = np.where(remplacement, np.where(rng.random(n_rows) < 0.5, _q("Remplacement SWAP"),
+                                              _q("Remplacement GDT")), _q("Réparation"))
+    brand = _pick(rng, BRAND_WEIGHTS, n_rows)
+    model_idx = rng.integers(0, 4, n_rows)
+    model = np.array([BRANDS[b][i % len(BRANDS[b])] for b, i in zip(brand, model_idx)], dtype=object)
+    # Quelques points GDT concentrent beaucoup de dossiers (loi de Zipf).
+    store = np.minimum(rng.zipf(1.3, n_rows), n_stores) - 1
+
+    df = pd.DataFrame({c: "" for c in COLUMNS}, index=pd.RangeIndex(n_rows))
+    df["IDdefiche"] = ids.astype(str)
+    df["Courriel"] = df["EMAIL"] = pd.Series(ids).map("client{}@exemple.fr".format)
+    df["Composeurmanuel"] = "0"
+    df["NIP"] = pd.Series(ids).map("NIP{:09d}".format)
+    df["Nomdusondage"] = "2025-AMV_Assurance_Mobile_GDT-global"
+    df["Langue"] = "fr"
+    df[DATE_COL] = dates
+    df["Codededisposition"] = dispo.astype(str)
+    df["Appareil"] = np.where(dispo == 0, "Unknown", _pick(rng, {"Smartphone": 712, "Desktop": 234}, n_rows))
+    df["Navigateur"] = np.where(dispo == 0, "Unknown",
+                                _pick(rng, {"Chrome": 595, "Safari": 268, "Edge": 44, "Firefox": 38}, n_rows))
+    df["Géolocalisation"] = "0.00000000000000,0.00000000000000"
+    df["URLduliendusondage"] = pd.Series(ids).map("https://enquetes.exemple.fr/S2/?st={:x}".format)
+    df["CIV"] = np.where(rng.random(n_rows) < 0.5, "Madame", "Monsieur")
+    df["TYPEAP"] = "téléphone"
+    df["TYPEPC"] = np.where(remplacement, _q("Remplacement"), _q("Réparation"))
+    df["TYPEPC2"] = typepc2
+    df["LIB_CHARGE"] = np.where(remplacement, "remplacé", "réparé")
+    df["NOM"] = pd.Series(ids).map("CLIENT {}".format)
+    df["MARQUE"] = brand
+    df["MODELE"] = model
+    df["CODEGDT"] = pd.Series(store).map("G{:04d}".format)
+    df["CODECFCA"] = (760000 + store).astype(str)
+    df["NOMMAG"] = pd.Series(store).map("MAGASIN {}".format)
+    df["TYPESI"] = _pick(rng, SINISTRES, n_rows)
+    df["VAGUE"] = "55"
+    df["DATEC"] = pd.DatetimeIndex(solicited).strftime("%d/%m/%Y")
+
+    # Questions posées : toutes pour les complétés, jusqu'au point d'abandon pour les code 2.
+    stop = np.where(dispo == 1, len(QUESTION_ORDER), np.where(dispo == 2, rng.integers(0, 6, n_rows), 0))
+    for rank, q in enumerate(QUESTION_ORDER):
+        asked = stop > rank
+        n = int(asked.sum())
+        if q == "Q2":
+            answers = (pd.Series(_pick(rng, dict.fromkeys(VERBATIM_DEBUT, 1), n))
+                       + pd.Series(_pick(rng, dict.fromkeys(VERBATIM_FIN, 1), n))).to_numpy()
+        else:
+            answers = _pick(rng, ANSWERS[q], n)
+        df.loc[asked, q] = answers
+    return df
+
+
+def write_export(path: Path, n_rows: int, seed: int = 0, chunk_rows: int = CHUNK_ROWS, **kwargs) -> Path:
+    """Écrit un export synthétique de ``n_rows`` lignes, bloc par bloc."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    kwargs.setdefault("n_stores", int(min(3000, max(50, n_rows // 300))))
+    with path.open("w", encoding=ENCODING, newline="") as f:
+        for i, start in enumerate(range(0, n_rows, chunk_rows)):
+            chunk = generate(min(chunk_rows, n_rows - start), seed=seed + i, first_id=start + 1, **kwargs)
+            chunk.to_csv(f, sep=SEP, index=False, header=i == 0)
+    return path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m amv.synth", description=__doc__.splitlines()[0])
+    parser.add_argument("sortie", type=Path)
+    parser.add_argument("--lignes", type=int, default=10_000)
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--mois", type=int, default=12)
+    args = parser.parse_args(argv)
+    write_export(args.sortie, args.lignes, seed=args.graine, months=args.mois)
+    print(f"{args.lignes} lignes écrites dans {args.sortie}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
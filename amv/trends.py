@@ -0,0 +1,106 @@
+"""Tendances mensuelles avec intervalles de confiance par bootstrap, sans boucle Python.
+
+Pour chaque mois et chaque TYPEPC (plus « Tous »), les réponses sont résumées par
+leurs effectifs : notes Q1, segments NPS (Q16) et complétés parmi les sollicités.
+La note et le NPS sont rattachés au mois de la réponse (cube), le taux de complétion
+au mois de sollicitation (DATEC) : les interrompus, sans date de connexion, y comptent.
+Rééchantillonner les réponses revient alors à tirer un vecteur d'effectifs dans une
+loi multinomiale (binomiale pour le taux de complétion) : ``Generator.multinomial``
+tire d'un coup les ``n_boot`` répliques de toutes les cellules.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import codes_for, modalities
+from amv.cube import ALL_TYPEPC, Cube
+from amv.kpi import NPS_SEGMENTS, ratio
+from amv.schema import DATE_COL, DISPO_COL, SOLICIT_COL, TYPEPC_COL
+
+INDICATORS = {
+    "nps": "Score NPS",
+    "note_moyenne_q1": "Note moyenne Q1",
+    "taux_completion": "Taux de complétion (%)",
+}
+N_BOOT = 2000
+
+
+def _multinomial(rng: np.random.Generator, counts: np.ndarray, n_boot: int) -> np.ndarray:
+    """Répliques ``(n_boot, cellules, modalités)`` des effectifs observés ``(cellules, modalités)``."""
+    n = counts.sum(axis=-1)
+    # Cellules vides : probabilités arbitraires, n = 0 donne des répliques nulles.
+    p = np.where(n[:, None] > 0, counts / np.maximum(n, 1)[:, None], 1 / counts.shape[-1])
+    return rng.multinomial(n, p, size=(n_boot, len(n)))
+
+
+def solicitation_counts(df: pd.DataFrame) -> tuple[np.ndarray, list, np.ndarray, np.ndarray]:
+    """Mois, TYPEPC (plus « Tous »), sollicités et complétés par mois de sollicitation.
+
+    Toutes les lignes sont des sollicitations, quelle que soit leur disposition. Le mois
+    est celui de DATEC, à défaut celui de la dernière connexion (exports sans DATEC).
+    """
+    when = df[DATE_COL]
+    if SOLICIT_COL in df.columns:
+        when = df[SOLICIT_COL].fillna(when)
+    when = when.to_numpy().astype("datetime64[M]")
+    known = ~np.isnat(when)
+    months, m_codes = np.unique(when[known], return_inverse=True)
+    t_codes, typepc = pd.factorize(df.loc[known, TYPEPC_COL].astype(object), sort=True, use_na_sentinel=False)
+    cell = m_codes * len(typepc) + t_codes
+    done = df[DISPO_COL].eq(1).to_numpy(bool, na_value=False)[known]
+    shape = (len(months), len(typepc))
+    solicited = np.bincount(cell, minlength=int(np.prod(shape))).reshape(shape)
+    completed = np.bincount(cell[done], minlength=int(np.prod(shape))).reshape(shape)
+    solicited, completed = (np.concatenate([a, a.sum(axis=1, keepdims=True)], axis=1) for a in (solicited, completed))
+    return months, [*typepc, ALL_TYPEPC], solicited, completed
+
+
+def bootstrap_trends(cube: Cube, df: pd.DataFrame, n_boot: int = N_BOOT, level: float = 0.95,
+                     seed: int = 0) -> pd.DataFrame:
+    """NPS, note moyenne Q1 et taux de complétion par mois × TYPEPC, avec leur intervalle.
+
+    Une ligne par (mois, TYPEPC, indicateur) : valeur observée, bornes de l'intervalle
+    percentile au niveau ``level`` et effectif sur lequel porte l'indicateur. ``df`` est
+    le jeu ligne à ligne dont le cube est issu (sollicités et complétés de chaque mois).
+    """
+    months, typepc, counts = cube.by_month(margins=True)
+    flat = counts.reshape(-1, *counts.shape[2:])             # (cellules, dispositions, cases)
+    dispositions = list(cube.dispositions)
+    comp = flat[:, dispositions.index(1)] if 1 in dispositions else np.zeros_like(flat[:, 0])
+    rng = np.random.default_rng(seed)
+
+    q1 = comp[:, cube.slots["Q1"]]
+    q16 = comp[:, cube.slots["Q16"]]
+    segments = np.stack([q16[:, codes_for("Q16", NPS_SEGMENTS[s])].sum(axis=1)
+                         for s in ("Promoters", "Passives", "Detractors")], axis=1)
+    s_months, s_typepc, solicited, completed = solicitation_counts(df)
+    solicited, completed = solicited.ravel(), completed.ravel()
+
+    scores = np.array(modalities("Q1"))
+    boot_q1 = _multinomial(rng, q1, n_boot)
+    boot_nps = _multinomial(rng, segments, n_boot)
+    p_comp = ratio(completed, solicited)
+    boot_comp = rng.binomial(solicited, np.nan_to_num(p_comp), size=(n_boot, len(solicited)))
+
+    answered = pd.MultiIndex.from_product([pd.PeriodIndex(months, freq="M"), typepc], names=["mois", "TYPEPC"])
+    cohorts = pd.MultiIndex.from_product([pd.PeriodIndex(s_months, freq="M"), s_typepc], names=["mois", "TYPEPC"])
+    # Indicateur -> (index, valeur observée, effectif, répliques)
+    observed = {
+        "nps": (answered, ratio(segments[:, 0] - segments[:, 2], segments.sum(1)) * 100, segments.sum(1),
+                ratio(boot_nps[..., 0] - boot_nps[..., 2], segments.sum(1)) * 100),
+        "note_moyenne_q1": (answered, ratio(q1 @ scores, q1.sum(1)), q1.sum(1),
+                            ratio(boot_q1 @ scores, q1.sum(1))),
+        "taux_completion": (cohorts, p_comp * 100, solicited, ratio(boot_comp, solicited) * 100),
+    }
+    alpha = (1 - level) / 2 * 100
+    frames = []
+    for name, (index, value, n, replicates) in observed.items():
+        valid = n > 0
+        low, high = np.full((2, len(n)), np.nan)
+        low[valid], high[valid] = np.percentile(replicates[:, valid], [alpha, 100 - alpha], axis=0)
+        frames.append(pd.DataFrame({"indicateur": name, "valeur": value, "ic_bas": low,
+                                    "ic_haut": high, "n": n}, index=index))
+    out = pd.concat(frames).reset_index()
+    return out[out["n"] > 0].round(2).reset_index(drop=True)
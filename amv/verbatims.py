@@ -0,0 +1,144 @@
+"""Recherche plein texte dans les verbatims, par index inversé.
+
+Chaque commentaire non vide (Q2, O_Q10, Q12) est un document. Son texte est replié
+comme pour Q3 (sans accents, en minuscules) puis découpé en mots ; l'index associe à
+chaque mot la liste triée des documents qui le contiennent. Une requête ne lit que
+ces listes : seules les expressions entre guillemets relisent le texte, et seulement
+celui des documents candidats.
+
+Syntaxe : mots (tous requis), ``"expression exacte"``, préfixe ``répar*``.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import fold
+from amv.schema import DATE_COL, TYPEPC_COL
+
+VERBATIM_COLUMNS = {
+    "Q2": "Q2 – Commentaire sur la satisfaction",
+    "O_Q10": "Q10 – Précisions sur le téléphone",
+    "Q12": "Q12 – Commentaire sur la réception",
+}
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+class _FoldTable(dict):
+    """Table ``str.translate`` repliant caractère par caractère (longueur conservée)."""
+
+    def __missing__(self, codepoint: int) -> str:
+        folded = fold(chr(codepoint))[:1]
+        self[codepoint] = folded if folded.isalnum() else " "
+        return self[codepoint]
+
+
+_FOLD = _FoldTable()
+
+
+def fold_aligned(text: str) -> str:
+    """``fold`` sans changer les positions : le surlignage se reporte sur le texte d'origine."""
+    return text.translate(_FOLD)
+
+
+def parse_query(query: str) -> list[tuple[tuple[str, ...], bool]]:
+    """Groupes ``(mots, préfixe)`` : une expression entre guillemets ou un mot isolé."""
+    groups = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query):
+        tokens = tuple(_WORD.findall(fold_aligned(phrase or word)))
+        if tokens:
+            groups.append((tokens, bool(word) and word.endswith("*") and len(tokens) == 1))
+    return groups
+
+
+@dataclass(frozen=True)
+class VerbatimIndex:
+    rows: np.ndarray        # document -> position de la réponse dans le jeu
+    columns: np.ndarray     # document -> indice dans VERBATIM_COLUMNS
+    texts: np.ndarray       # document -> texte d'origine
+    terms: np.ndarray       # vocabulaire trié
+    indptr: np.ndarray      # mot i -> postings[indptr[i]:indptr[i + 1]]
+    postings: np.ndarray    # documents, triés pour chaque mot
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "VerbatimIndex":
+        rows, columns, texts = [], [], []
+        for j, col in enumerate(VERBATIM_COLUMNS):
+            if col not in df.columns:
+                continue
+            values = df[col]
+            pos = np.flatnonzero(values.notna().to_numpy() & (values.astype(str).str.strip() != "").to_numpy())
+            rows.append(pos)
+            columns.append(np.full(len(pos), j, dtype=np.int8))
+            texts.append(values.to_numpy()[pos])
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        texts = np.concatenate(texts) if texts else np.empty(0, dtype=object)
+
+        words = pd.Series(texts, dtype=object).map(fold_aligned).str.findall(_WORD).explode().dropna()
+        pairs = pd.DataFrame({"doc": words.index.to_numpy(np.int32), "term": words.to_numpy()}).drop_duplicates()
+        term_ids, terms = pd.factorize(pairs["term"], sort=True)
+        order = np.lexsort((pairs["doc"].to_numpy(), term_ids))
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(term_ids, minlength=len(terms)))])
+        return cls(rows=rows, columns=np.concatenate(columns) if columns else np.empty(0, dtype=np.int8),
+                   texts=texts, terms=np.asarray(terms, dtype=object), indptr=indptr,
+                   postings=pairs["doc"].to_numpy()[order])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _postings(self, term: str, prefix: bool = False) -> np.ndarray:
+        lo = int(np.searchsorted(self.terms, term))
+        if prefix:
+            # Vocabulaire en [a-z0-9] : « { » suit « z », les mots du préfixe sont tous avant.
+            hi = int(np.searchsorted(self.terms, term + "{"))
+        else:
+            hi = lo + int(lo < len(self.terms) and self.terms[lo] == term)
+        docs = self.postings[self.indptr[lo]:self.indptr[hi]]  # listes contiguës dans l'ordre du vocabulaire
+        return np.unique(docs) if hi - lo > 1 else docs
+
+    def search(self, query: str) -> np.ndarray:
+        """Documents contenant tous les groupes de la requête, triés."""
+        docs = []
+        for tokens, prefix in parse_query(query):
+            hits = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True),
+                          (self._postings(t, prefix) for t in tokens))
+            if len(tokens) > 1:
+                phrase = re.compile(r"\b" + r"[^a-z0-9]+".join(tokens) + r"\b")
+                hits = hits[[bool(phrase.search(fold_aligned(self.texts[d]))) for d in hits]]
+            docs.append(hits)
+        if not docs:
+            return np.empty(0, dtype=np.intp)
+        return reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), docs)
+
+
+def hits_by_month(df: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+    """Réponses trouvées par mois × TYPEPC, avec totaux ; une réponse trouvée dans plusieurs
+    commentaires ne compte qu'une fois."""
+    hits = df.iloc[np.unique(rows)]
+    month = hits[DATE_COL].dt.strftime("%Y-%m").fillna("Sans date").rename("Mois")
+    typepc = hits[TYPEPC_COL].astype(object).fillna("Non renseigné").rename("TYPEPC")
+    return pd.crosstab(month, typepc, margins=True, margins_name="Total")
+
+
+def highlight(text: str, query: str, width: int = 160) -> str:
+    """Extrait HTML autour de la première occurrence, occurrences entourées de ``<mark>``."""
+    groups = parse_query(query)
+    patterns = [r"[^a-z0-9]+".join(tokens) + (r"[a-z0-9]*" if prefix else r"\b") for tokens, prefix in groups]
+    spans = [m.span() for p in patterns for m in re.finditer(r"\b" + p, fold_aligned(text))] if patterns else []
+    start = max(0, min((a for a, _ in spans), default=0) - width // 3)
+    end = min(len(text), start + width)
+    out, pos = [], start
+    for a, b in sorted(spans):
+        a, b = max(a, pos), min(b, end)
+        if a >= b:
+            continue
+        out += [html.escape(text[pos:a]), "<mark>", html.escape(text[a:b]), "</mark>"]
+        pos = b
+    out.append(html.escape(text[pos:end]))
+    return ("… " if start else "") + "".join(out) + (" …" if end < len(text) else "")
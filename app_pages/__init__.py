@@ -0,0 +1,41 @@
+"""Pages de l'application, importées à la demande par main.py.
+
+Ce module reste léger (ni pandas ni Plotly) : la page d'accueil ne paie que Streamlit.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+from amv.paths import RAW_DIR, ROOT, STORE_DIR
+
+primary_color   = "#E63947"
+background_card = "#F8F9FA"
+
+# Chemins relatifs des assets (⚠️ respect de la casse des noms de fichiers)
+LOGO_ORANGE = ROOT / "Assurance mobile orange.PNG"      # mets exactement le même nom que dans le repo
+LOGO_UNIV   = ROOT / "Logo PARIS 1.PNG"
+
+# Profilage à la demande : AMV_PROFIL=1 ou « ?profil=1 » dans l'URL ; une ligne JSON par exécution.
+PROFILE_LOG = Path(os.environ.get("AMV_PROFIL_LOG", ROOT / "Donnee" / "3_journaux" / "profil.jsonl"))
+
+# Libellé du menu -> module de page (fonction ``render``)
+PAGES = {"Projet mémoire": "accueil", "Suivi mensuel": "suivi", "Dashboard": "dashboard", "Classement": "classement"}
+
+_warm_up_lock = threading.Lock()
+_warm_up_started = False
+
+
+def _warm_up() -> None:
+    from app_pages.data import warm_up
+    warm_up()
+
+
+def start_warm_up() -> None:
+    """Lance une seule fois par processus le chargement du jeu partagé en tâche de fond."""
+    global _warm_up_started
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+    threading.Thread(target=_warm_up, name="amv-prechargement", daemon=True).start()
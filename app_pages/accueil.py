@@ -0,0 +1,121 @@
+"""Page « Projet mémoire » : statique, sans pandas ni Plotly."""
+
+import streamlit as st
+
+from app_pages import LOGO_ORANGE, LOGO_UNIV, primary_color
+
+
+def render():
+    styles = f"""
+    <style>
+      :root {{ --primary: {primary_color}; }}
+      .app-title h1 {{ color: var(--primary); margin-bottom:.25rem; }}
+      .subtitle {{ font-size:.95rem; color:#6b7280; margin-bottom:1.25rem; }}
+      .card {{ background:#fff; border-radius:14px; padding:20px;
+              box-shadow:0 6px 24px rgba(0,0,0,.06),0 2px 8px rgba(0,0,0,.04);
+              border:1px solid #eef2f7; }}
+      .section-title {{ margin:0 0 10px; font-size:1.15rem; color:#111827; }}
+      .lead {{ font-size:.98rem; line-height:1.6; color:#1f2937; margin:0; }}
+      .badge,.hero-tag {{ display:inline-flex; align-items:center; gap:8px;
+              padding:6px 10px; border-radius:999px; font-size:.85rem;
+              background:#f9fafb; border:1px solid #e5e7eb; }}
+      .badge .dot {{ width:8px; height:8px; border-radius:50%; background:var(--primary); }}
+      .checklist {{ list-style:none; padding:0; margin:0; }}
+      .checklist li {{ padding:10px; margin:6px 0; border:1px dashed #e5e7eb;
+                      border-radius:10px; background:#fcfcfd; display:flex; gap:10px; }}
+      .checkmark {{ color:var(--primary); font-weight:700; }}
+      .pill {{ padding:4px 10px; border-radius:999px; background:rgba(255,121,0,.08);
+              color:var(--primary); border:1px solid rgba(255,121,0,.25); font-size:.85rem; }}
+      .hero {{ border-radius:16px; padding:22px;
+              background:linear-gradient(135deg,rgba(255,121,0,.12),rgba(255,121,0,.04));
+              border:1px solid rgba(255,121,0,.25); margin-top:6px; position:relative; }}
+      .hero-title {{ font-weight:700; display:flex; gap:8px; margin-bottom:8px; }}
+      .hero-title .icon {{ width:28px; height:28px; border-radius:8px;
+                          background:var(--primary); color:#fff; display:flex;
+                          align-items:center; justify-content:center; }}
+      .hero-list {{ display:grid; grid-template-columns:repeat(3,1fr); gap:10px; margin-top:12px; }}
+      .hero-item {{ border:1px dashed #e5e7eb; border-radius:12px; padding:10px;
+                   font-size:.92rem; display:flex; gap:10px; }}
+      .hero-bullet {{ color:var(--primary); font-weight:700; }}
+      @media(max-width:900px){{ .hero-list{{ grid-template-columns:1fr; }} }}
+    </style>
+    """
+    st.markdown(styles, unsafe_allow_html=True)
+
+    col_title, col_logo1, col_logo2 = st.columns([1.2, 1, 1])
+    with col_title:
+        st.markdown("<div class='app-title'><h1>📚 Projet mémoire</h1></div>", unsafe_allow_html=True)
+        st.markdown("<p class='subtitle'>Suivi mensuel des enquêtes de satisfaction – Assurance mobile Orange</p>", unsafe_allow_html=True)
+
+    for col, path, caption in zip(
+        (col_logo1, col_logo2),
+        (LOGO_ORANGE, LOGO_UNIV),
+        ("Assurance mobile Orange", "Université Paris 1"),
+    ):
+        with col:
+            if path.exists():
+                st.image(str(path), caption=caption, use_container_width=True)
+            else:
+                st.caption(f"🔎 Logo {caption} introuvable : `{path.name}`")
+
+    st.write("")
+
+    c1, c2 = st.columns((1.4, 1))
+    with c1:
+        st.markdown("""
+        <div class="card">
+          <h3 class="section-title">Contexte</h3>
+          <p class="lead">
+            Dans le cadre du suivi de la qualité de service, une enquête de satisfaction est conduite mensuellement auprès des clients d’Orange ayant souscrit à une assurance mobile et ayant sollicité une prise en charge, que ce soit pour une réparation ou un remplacement de leur appareil.
+          </p>
+          <p class="lead" style="margin-top:12px;">
+            Ce dispositif vise à évaluer de manière régulière le niveau de satisfaction des clients et à suivre l’évolution des principaux indicateurs de performance. Les résultats sont transmis au client chaque mois afin de disposer d’une vision claire et actualisée de la qualité perçue et d’orienter, le cas échéant, les actions d’amélioration.
+          </p>
+          <p class="lead" style="margin-top:12px;">
+            Le présent dashboard a pour finalité d’automatiser ce processus de suivi, de centraliser les données collectées et de mettre à disposition une visualisation synthétique et dynamique des indicateurs clés.
+          </p>
+          <div class="badges" style="margin-top:14px;">
+            <span class="badge"><span class="dot"></span> Suivi mensuel</span>
+            <span class="badge"><span class="dot"></span> Satisfaction client</span>
+            <span class="badge"><span class="dot"></span> Indicateurs de performance</span>
+          </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with c2:
+        st.markdown("""
+        <div class="card">
+          <h3 class="section-title">Objectifs</h3>
+          <ul class="checklist">
+            <li><span class="checkmark">✓</span> Charger, nettoyer et préparer les données.</li>
+            <li><span class="checkmark">✓</span> Explorer les réponses (EDA).</li>
+            <li><span class="checkmark">✓</span> Mettre en place un suivi mensuel interactif.</li>
+            <li><span class="checkmark">✓</span> Développer un dashboard final.</li>
+          </ul>
+          <p class="hint" style="margin-top:10px;">
+            Astuce : utilisez les filtres ci-dessus pour limiter l’analyse par période, canal ou motif (réparation/remplacement).
+          </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="hero">
+      <div class="hero-title"><span class="icon">★</span><span>Introduction au module</span></div>
+      <p class="hero-text">
+        Accédez aux sections de données, d’analyses et de reporting pour suivre les tendances,
+        comparer les périodes et produire vos KPI mensuels. Ce module centralise les informations
+        essentielles pour un pilotage fluide de la satisfaction client.
+      </p>
+      <div class="hero-tags">
+        <span class="hero-tag">Suivi mensuel</span>
+        <span class="hero-tag">EDA & KPIs</span>
+        <span class="hero-tag">Automatisation</span>
+      </div>
+      <div class="hero-list">
+        <div class="hero-item"><span class="hero-bullet">•</span> Filtrez par période, canal ou motif (réparation / remplacement).</div>
+        <div class="hero-item"><span class="hero-bullet">•</span> Surveillez l’évolution des indicateurs clés mois par mois.</div>
+        <div class="hero-item"><span class="hero-bullet">•</span> Exportez des vues prêtes à communiquer aux parties prenantes.</div>
+      </div>
+    </div>
+    """, unsafe_allow_html=True)
+
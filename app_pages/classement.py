@@ -0,0 +1,54 @@
+"""Page « Classement » : points de service, marques et modèles classés par indicateur."""
+
+import streamlit as st
+
+from amv import profiling
+from amv.leaderboard import DIMENSIONS, METRICS, group_stats, rank
+from app_pages import primary_color
+from app_pages.data import get_dataset, load_dataset
+
+COLUMNS = {"rang": "Rang", "completes": "Complétés", "sollicites": "Sollicités", "nps": "NPS",
+           "note_moyenne_q1": "Note Q1", "pct_compliquees_q15": "Q15 compliquées (%)",
+           "taux_completion": "Complétion (%)"}
+
+
+@profiling.counted(st.cache_data(max_entries=8, show_spinner=False))
+def leaderboard_stats(signature, dim):
+    """Indicateurs de tous les groupes d'une dimension, une fois par version des données."""
+    data = get_dataset(signature)
+    return group_stats(data.df, data.groups, dim)
+
+
+def _on_row_select(dim, ranked):
+    rows = st.session_state.classement_table.selection.rows
+    if rows:
+        st.session_state.dashboard_group = (dim, ranked.index[rows[0]])
+
+
+def render():
+    st.markdown(f"<h1 style='color:{primary_color};'>🏆 Classement des points de service et des appareils</h1>", unsafe_allow_html=True)
+
+    signature, _ = load_dataset()
+
+    c1, c2, c3 = st.columns((1.2, 1.2, 1))
+    dim = c1.radio("Classer", list(DIMENSIONS), format_func=DIMENSIONS.get, horizontal=True)
+    metric = c2.selectbox("Indicateur", list(METRICS), format_func=lambda m: METRICS[m][0])
+    min_n = c3.number_input("Effectif minimum", min_value=1, value=30, step=5,
+                            help="Réponses nécessaires pour l'indicateur ; en dessous, le groupe n'est pas classé.")
+
+    stats = leaderboard_stats(signature, dim)
+    ranked = rank(stats, metric, int(min_n))
+    st.caption(f"{len(ranked)} groupes classés sur {len(stats)} "
+               f"({len(stats) - len(ranked)} sous le seuil de {int(min_n)} réponses).")
+
+    table = ranked[list(COLUMNS)].rename(columns=COLUMNS)
+    table.index = table.index.astype(str)
+    st.dataframe(table, use_container_width=True, key="classement_table", on_select=lambda: _on_row_select(dim, ranked),
+                 selection_mode="single-row")
+
+    if group := st.session_state.get("dashboard_group"):
+        g1, g2 = st.columns((4, 1))
+        g1.success(f"Dashboard filtré sur {DIMENSIONS[group[0]]} = {group[1]} : ouvrez la page Dashboard.")
+        g2.button("Retirer le filtre", on_click=lambda: st.session_state.pop("dashboard_group", None))
+    else:
+        st.caption("Sélectionnez une ligne pour filtrer le Dashboard sur ce groupe.")
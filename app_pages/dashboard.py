@@ -0,0 +1,218 @@
+"""Page « Dashboard » : indicateurs par section, calculés sur le cube pré-agrégé."""
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from amv import profiling
+from amv.bitmaps import codes_of
+from amv.cube import ALL_TYPEPC
+from amv.figures import (REPARTITION_NPS, REPARTITION_Q1, SECTION_CHARTS, chart_question, fig_repartition,
+                         fig_trend)
+from amv.kpi import SECTIONS
+from amv.leaderboard import DIMENSIONS
+from amv.trends import INDICATORS, N_BOOT, bootstrap_trends
+from amv.schema import DATE_COL
+from app_pages import primary_color
+from app_pages.data import figure_cache, get_dataset, load_dataset, plot
+
+
+@profiling.counted(st.cache_data(max_entries=256, show_spinner=False))
+def section_indicators(signature, filters, section):
+    """Indicateurs d'une section, mis en cache par état des filtres."""
+    start, end, typepc, completes, cross, group = filters
+    data = get_dataset(signature)
+    dispositions = [1] if completes else []
+    if cross or group:
+        # Filtres croisés : ET de bitmaps par modalité sur les lignes de la période,
+        # restreintes au besoin aux lignes du groupe (index des groupes, positions triées).
+        rows = data.dates.span(start, end)
+        if group:
+            pos = data.groups.rows(*group)
+            rows = pos[np.searchsorted(pos, rows.start):np.searchsorted(pos, rows.stop)]
+        n_comp, tallies = data.bitmaps.select(rows, typepc, dispositions,
+                                              {q: codes_of(q, labels) for q, labels in cross})
+    else:
+        n_comp, tallies = data.cube.select(start, end, typepc, dispositions)
+    return SECTIONS[section](n_comp, tallies)
+
+
+@profiling.counted(st.cache_data(max_entries=4, show_spinner="Rééchantillonnage…"))
+def monthly_trends(signature):
+    """Tendances mensuelles et intervalles bootstrap de tous les TYPEPC, une fois par version."""
+    data = get_dataset(signature)
+    return bootstrap_trends(data.cube, data.df)
+
+
+def _on_chart_select(key, question):
+    """Les points sélectionnés d'un graphique deviennent le filtre croisé de sa question."""
+    points = st.session_state[key].selection.points
+    labels = tuple(sorted({p["x"] for p in points if "x" in p}, key=str))
+    if labels:
+        st.session_state.cross_filters[question] = labels
+    else:
+        st.session_state.cross_filters.pop(question, None)
+
+
+def _reset_cross_filters():
+    st.session_state.cross_filters = {}
+    st.session_state.cross_gen += 1  # nouvelles clés : les sélections affichées sont effacées
+    st.session_state.pop("dashboard_group", None)
+
+
+def render():
+    st.markdown(f"<h1 style='color:{primary_color}; text-align:center;'>📈 Dashboard Final</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align:center; color:gray;'>Suivi des indicateurs clés</p>", unsafe_allow_html=True)
+    st.markdown("---")
+
+    st.markdown("""
+        <style>
+            h2 { padding-top: 10px; color: #2F4F4F; }
+            .block-header { display: flex; align-items: center; padding-bottom: 10px;
+                            border-left: 5px solid #2F4F4F; margin-bottom: 20px; }
+            .metric-card { background: #ffffff; padding: 20px; border-radius: 8px;
+                           box-shadow: 0 1px 3px rgba(0,0,0,0.1); text-align: center; margin-bottom: 10px; }
+            .metric-label { margin: 0; font-weight: 600; color: #555; }
+            .metric-value { margin: 5px 0; font-size: 1.5rem; font-weight: 700; color: #333; }
+        </style>
+    """, unsafe_allow_html=True)
+
+    prof = profiling.current()
+    signature, data = load_dataset()
+    cube = data.cube
+
+    typepc_vals = ["Tous"] + sorted(t for t in cube.typepc if isinstance(t, str))
+    sel_typepc  = st.sidebar.selectbox("TYPEPC", typepc_vals)
+    typepc      = None if sel_typepc == "Tous" else sel_typepc
+
+    bounds = cube.date_bounds(typepc)
+    if bounds is None:
+        st.error(f"Aucune réponse datée (colonne ‘{DATE_COL}’) pour ce TYPEPC.")
+        st.stop()
+    start_date = st.sidebar.date_input("Date de début", bounds[0])
+    end_date   = st.sidebar.date_input("Date de fin",   bounds[1])
+    dispo      = st.sidebar.multiselect("Disposition", [0, 1, 2], default=[1])
+
+    # Filtres croisés : {question: libellés cliqués}, conservés d'un rerun à l'autre.
+    st.session_state.setdefault("cross_filters", {})
+    st.session_state.setdefault("cross_gen", 0)
+    cross = tuple(sorted(st.session_state.cross_filters.items()))
+    # Groupe choisi dans la page Classement : (dimension, libellé), par exemple ("CODEGDT", "G593").
+    group = st.session_state.get("dashboard_group")
+
+    # Filtres normalisés : seuls les complétés (code 1) comptent, quelle que soit la liste cochée.
+    filters = (start_date, end_date, typepc, 1 in dispo, cross, group)
+
+    def dashboard_section(signature, filters, section, choix=None):
+        """Indicateurs et graphiques d'une section ; les figures viennent du cache LRU partagé."""
+        ind = section_indicators(signature, filters, section)
+        version = data.version
+        figs = {}
+        for cid, build in SECTION_CHARTS[section].items():
+            if build is fig_repartition:
+                key, make = (version, filters + (choix,), f"{section}.{cid}"), lambda: build(ind, choix)
+            else:
+                key, make = (version, filters, f"{section}.{cid}"), lambda build=build: build(ind)
+            figs[cid] = prof.lookup("figure_cache", figure_cache().get, key, make)
+        return ind, figs
+
+    def chart(figs, cid):
+        """Graphique cliquable : sa sélection filtre tous les autres graphiques du Dashboard."""
+        question = chart_question(cid, choix)
+        key = f"cross_{cid}_{question}_{st.session_state.cross_gen}"
+        plot(figs[cid], key=key, on_select=partial(_on_chart_select, key, question), selection_mode="points")
+
+    def metric_card(col, label, value, style=""):
+        col.markdown(f"<div class='metric-card'{style}><p class='metric-label'>{label}</p><p class='metric-value'>{value}</p></div>", unsafe_allow_html=True)
+
+    def lazy_section(section, background, title, compute=None):
+        """En-tête de section ; indicateurs et graphiques calculés seulement une fois la section ouverte."""
+        st.markdown(f"<div style='background-color: {background}; padding: 30px; border-radius: 12px; box-shadow: 0 2px 6px rgba(0,0,0,0.05); margin-bottom: 40px;'>", unsafe_allow_html=True)
+        st.markdown(f"<div class='block-header'><h2>{title}</h2></div>", unsafe_allow_html=True)
+        if not st.toggle("Afficher la section", key=f"section_{section}"):
+            st.markdown("</div>", unsafe_allow_html=True)
+            return None
+        return compute() if compute else dashboard_section(signature, filters, section)
+
+    choix = st.radio("Sélectionnez la répartition à afficher", (REPARTITION_Q1, REPARTITION_NPS), horizontal=True)
+
+    if cross or group:
+        active = ([f"{DIMENSIONS[group[0]]} = {group[1]}"] if group else []) + [
+            f"{q} = {', '.join(map(str, labels))}" for q, labels in cross]
+        c1, c2 = st.columns((4, 1))
+        c1.info("Filtres croisés : " + " · ".join(active))
+        c2.button("Réinitialiser les filtres", on_click=_reset_cross_filters)
+    else:
+        st.caption("Cliquez sur une barre d'un graphique pour filtrer tout le Dashboard.")
+
+    # — AFFICHAGE —
+    with st.container():
+        ind, figs = dashboard_section(signature, filters, "global", choix)
+        st.markdown("<div style='background-color: #F7F9FA; padding: 30px; border-radius: 12px; box-shadow: 0 2px 6px rgba(0,0,0,0.05); margin-bottom: 40px;'>", unsafe_allow_html=True)
+        st.markdown("<div class='block-header'><h2>🔎 INDICATEURS GLOBAUX</h2></div>", unsafe_allow_html=True)
+        cols = st.columns(3, gap='large')
+        metric_card(cols[0], '✔️ Total complétés', ind["n_comp"])
+        metric_card(cols[1], '⭐ Note moyenne Q1', f"{ind['mean_q1']:.2f}/10")
+        metric_card(cols[2], '📊 Score NPS', f"{ind['nps_score']:.1f}")
+        chart(figs, "repartition")
+        chart(figs, "q15")
+        subtots = st.columns(2, gap='large')
+        metric_card(subtots[0], '✅ TOTAL SIMPLES', f"{ind['pct_simples']:.1f}%")
+        metric_card(subtots[1], '🔧 TOTAL COMPLIQUÉES', f"{ind['pct_compliquees']:.1f}%")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.container():
+        if section := lazy_section("souscription", "#FCFCFC", "🔑 Souscription du contrat"):
+            ind, figs = section
+            chart(figs, "q3")
+            c1, c2 = st.columns(2, gap='large')
+            metric_card(c1, '✅ Suffisantes + complétées', f"{ind['total_suff_compl']} ({ind['pct_suff_compl']:.1f}%)")
+            metric_card(c2, '⚠️ Insuffisantes + Nul', f"{ind['total_insuff_nil']} ({ind['pct_insuff_nil']:.1f}%)")
+            st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.container():
+        if section := lazy_section("declaration", "#F1F7ED", "📝 Déclaration du sinistre"):
+            ind, figs = section
+            chart(figs, "q6")
+            metric_card(st, '🔧 TOTAL Orange', f"{ind['pct_orange']:.1f}% ({ind['total_orange']})", " style='margin-top:20px;'")
+            chart(figs, "q5")
+            chart(figs, "q7")
+            st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.container():
+        if section := lazy_section("suivi", "#FAF3F0", "🕒 Suivi du dossier & Délai"):
+            ind, figs = section
+            col1, col2 = st.columns(2, gap='large')
+            with col1: chart(figs, "q8")
+            with col2: chart(figs, "q13")
+            st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.container():
+        if section := lazy_section("reception", "#F7F9FA", "📱 Réception du téléphone"):
+            ind, figs = section
+            col1, col2 = st.columns(2, gap='large')
+            with col1: chart(figs, "q9")
+            with col2: chart(figs, "q11")
+            st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.container():
+        trends = lazy_section("tendances", "#FCFCFC", "📉 Tendances mensuelles", lambda: monthly_trends(signature))
+        if trends is not None:
+            # Période et TYPEPC du Dashboard ; les filtres croisés et de groupe ne s'appliquent pas ici.
+            # La période porte sur la date de réponse : les mois de sollicitation (taux de
+            # complétion) la précèdent et sont donc tous affichés.
+            in_period = trends["mois"].between(pd.Period(start_date, "M"), pd.Period(end_date, "M"))
+            scope = (trends["TYPEPC"] == (typepc or ALL_TYPEPC)) & (
+                in_period | (trends["indicateur"] == "taux_completion"))
+            cols = st.columns(len(INDICATORS), gap='large')
+            for col, (name, title) in zip(cols, INDICATORS.items()):
+                trend = trends[scope & (trends["indicateur"] == name)]
+                key = (data.version, (typepc, start_date, end_date), f"tendances.{name}")
+                with col:
+                    plot(prof.lookup("figure_cache", figure_cache().get, key, lambda: fig_trend(trend, title)))
+            st.caption(f"Intervalles de confiance à 95 % par bootstrap ({N_BOOT} rééchantillonnages par mois et TYPEPC). "
+                       "Taux de complétion : complétés parmi tous les sollicités, interrompus compris, "
+                       "par mois de sollicitation (DATEC), sur tout l'historique.")
+            st.markdown("</div>", unsafe_allow_html=True)
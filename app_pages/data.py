@@ -0,0 +1,85 @@
+"""Accès aux données partagé par les pages : jeu en cache, figures, rendu, profilage."""
+
+import pandas as pd
+import streamlit as st
+
+from amv import profiling
+from amv.dataset import Dataset, build_dataset, version_of
+from amv.figures import FigureCache
+from amv.store import load_store, raw_signature, update_store
+from amv.verbatims import VerbatimIndex
+from app_pages import PROFILE_LOG, RAW_DIR, ROOT, STORE_DIR
+
+# Le jeu partagé n'est jamais modifié en place : toute écriture d'une page porte sur sa copie.
+pd.set_option("mode.copy_on_write", True)
+
+
+@profiling.counted(st.cache_resource(max_entries=2, show_spinner=False))
+def get_dataset(signature: tuple) -> Dataset:
+    """Jeu unique partagé par les pages et les sessions, sans copie ni désérialisation.
+
+    La signature des exports sert de clé : un nouvel export crée une nouvelle version,
+    et seules les deux plus récentes restent en mémoire.
+    """
+    prof = profiling.current()
+    with prof.stage("ingestion"):
+        update_store(RAW_DIR, STORE_DIR)
+    with prof.stage("lecture"):
+        raw = load_store(STORE_DIR)
+    return build_dataset(raw, version_of(signature))
+
+
+@profiling.counted(st.cache_resource(max_entries=2, show_spinner="Indexation des verbatims…"))
+def get_verbatim_index(signature: tuple) -> VerbatimIndex:
+    """Index inversé des commentaires libres, construit à la première recherche de chaque version."""
+    return VerbatimIndex.build(get_dataset(signature).df)
+
+
+def load_dataset() -> tuple[tuple, Dataset]:
+    """Signature et jeu courants ; en cas d'échec, l'erreur est affichée et la page arrêtée."""
+    signature = raw_signature(RAW_DIR)
+    if not signature:
+        st.error(f"Aucun export CSV dans `{RAW_DIR.relative_to(ROOT)}`")
+        st.stop()
+    try:
+        return signature, get_dataset(signature)
+    except Exception as e:
+        st.error(f"Impossible de lire les exports CSV : {e}")
+        st.stop()
+
+
+def warm_up() -> None:
+    """Préchargement (fil d'arrière-plan) : remplit le cache de ``get_dataset`` sans rien afficher."""
+    signature = raw_signature(RAW_DIR)
+    if signature:
+        try:
+            get_dataset(signature)
+        except Exception:
+            pass  # la page de données refera la tentative et affichera l'erreur
+
+
+@st.cache_resource(show_spinner=False)
+def figure_cache() -> FigureCache:
+    """Figures Plotly déjà construites, partagées par toutes les sessions (LRU borné)."""
+    return FigureCache(max_entries=512, max_bytes=64 * 2**20)
+
+
+def plot(fig, **kwargs):
+    """``st.plotly_chart`` pleine largeur, chronométré (sérialisation de la figure)."""
+    with profiling.current().stage("rendu plotly"):
+        return st.plotly_chart(fig, use_container_width=True, **kwargs)
+
+
+def profiling_panel(prof: profiling.Profiler):
+    """Panneau développeur : durées, caches et mémoire de l'exécution qui s'achève."""
+    rec = prof.write(PROFILE_LOG)
+    with st.sidebar.expander("🛠️ Profilage de l'exécution", expanded=True):
+        st.caption(f"Total : {rec['total_s'] * 1000:.0f} ms – journal `{PROFILE_LOG.name}`")
+        if rec["stages"]:
+            stages = pd.DataFrame.from_dict(rec["stages"], orient="index").rename_axis("étape")
+            st.dataframe(stages.assign(ms=(stages.pop("s") * 1000).round(1)), use_container_width=True)
+        if rec["caches"]:
+            st.dataframe(pd.DataFrame.from_dict(rec["caches"], orient="index").rename_axis("cache"),
+                         use_container_width=True)
+        for name, mb in rec["memoire_mo"].items():
+            st.caption(f"{name} : {mb:.1f} Mo")
@@ -0,0 +1,131 @@
+"""Page « Suivi mensuel » : volumes par disposition, détail paginé et recherche dans les verbatims."""
+
+import html
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from amv import profiling
+from amv.dataset import DISPOSITIONS
+from amv.pagination import paginate
+from amv.schema import DATE_COL
+from amv.verbatims import VERBATIM_COLUMNS, highlight, hits_by_month
+from app_pages import background_card, primary_color
+from app_pages.data import get_verbatim_index, load_dataset, plot
+
+
+def verbatim_search(signature, data, selected):
+    """Recherche par mots-clés dans les commentaires libres, via l'index inversé de la version."""
+    prof = profiling.current()
+    c1, c2, c3 = st.columns((3, 1, 1))
+    query = c1.text_input("Mots-clés", placeholder='batterie  "service client"  répar*')
+    scoped = c2.toggle("Limiter aux filtres de la page", value=True)
+    limit = c3.selectbox("Verbatims affichés", (20, 50, 100))
+    if not query.strip():
+        st.caption("Tous les mots sont requis ; \"…\" pour une expression exacte, * pour un préfixe. "
+                   "Accents et majuscules sont ignorés.")
+        return
+
+    index = get_verbatim_index(signature)
+    with prof.stage("recherche verbatims"):
+        docs = index.search(query)
+        if scoped:
+            keep = np.zeros(len(data.df), dtype=bool)
+            keep[selected] = True
+            docs = docs[keep[index.rows[docs]]]
+    rows = index.rows[docs]
+    st.caption(f"{len(docs)} verbatims correspondants ({len(np.unique(rows))} réponses)")
+    if not len(docs):
+        return
+
+    st.dataframe(hits_by_month(data.df, rows), use_container_width=True)
+
+    labels = list(VERBATIM_COLUMNS.values())
+    for i in np.argsort(-rows, kind="stable")[:limit]:  # plus récents d'abord (jeu trié par date)
+        row = data.df.iloc[rows[i]]
+        date = row[DATE_COL].strftime("%d/%m/%Y") if pd.notna(row[DATE_COL]) else "Sans date"
+        st.markdown(
+            f"<div style='background:{background_card}; padding:10px 14px; border-radius:8px; margin-bottom:8px;'>"
+            f"<small><b>{date}</b> · {html.escape(str(row['TYPEPC']))} · {labels[index.columns[docs[i]]]}</small><br>"
+            f"{highlight(index.texts[docs[i]], query)}</div>",
+            unsafe_allow_html=True,
+        )
+
+
+def render():
+    st.markdown(f"<h1 style='color:{primary_color};'>📊 Suivi mensuel des réponses</h1>", unsafe_allow_html=True)
+
+    prof = profiling.current()
+    signature, data = load_dataset()
+    code_map = DISPOSITIONS
+    inv = {v: k for k, v in code_map.items()}
+
+    st.sidebar.markdown(f"<h4 style='color:{primary_color};'>Filtres</h4>", unsafe_allow_html=True)
+    sel_code = st.sidebar.selectbox("Code de disposition", ["Tous"] + list(code_map.values()))
+    code = None if sel_code == "Tous" else inv[sel_code]
+
+    bounds = data.dates.bounds(code)
+    if bounds is None:
+        st.error(f"La colonne ‘{DATE_COL}’ contient trop de NaT ou est mal formatée.")
+        st.stop()
+    min_d, max_d = bounds
+
+    start_date, end_date = st.sidebar.slider("Période", min_value=min_d, max_value=max_d, value=(min_d, max_d), format="DD/MM/YYYY")
+    # Recherche dichotomique dans le jeu trié ; les interrompus (code 0) restent inclus.
+    with prof.stage("filtre"):
+        selected = data.dates.select(start_date, end_date, code)
+        df = data.df.iloc[selected, :][data.answer_columns]
+    prof.frame("jeu partagé", data.df)
+    prof.frame("sélection", df)
+
+    total = df["Codededisposition"].isin([0, 1, 2]).sum()
+    comp  = (df["Codededisposition"] == 1).sum()
+    inter = (df["Codededisposition"] == 2).sum()
+    pct_c = comp/total*100 if total else 0
+    pct_i = inter/total*100 if total else 0
+
+    k1, k2, k3 = st.columns(3, gap="large")
+    def render_card(col, icon, title, value, delta=None):
+        col.markdown(
+            f"<div style='background:{background_card}; padding:20px; border-radius:8px; text-align:center;'>"
+            f"<h3>{icon} {title}</h3><h1>{value}</h1>"
+            + (f"<p style='color:{primary_color}; margin:0;'>{delta}</p>" if delta else "")
+            + "</div>",
+            unsafe_allow_html=True,
+        )
+    render_card(k1, "👥", "Total sollicités", total)
+    render_card(k2, "✅", "Complétés", f"{pct_c:.1f}%", comp)
+    render_card(k3, "⏸️", "Interrompus", f"{pct_i:.1f}%", inter)
+
+    st.markdown("---")
+
+    # Détail paginé côté serveur : rien n'est envoyé au navigateur tant qu'il reste fermé.
+    if st.toggle("🔍 Voir le détail des réponses filtrées"):
+        default_cols = [c for c in (DATE_COL, "Codededisposition", "disposition", "TYPEPC", "MARQUE", "MODELE",
+                                    "CODEGDT", "Q1", "Q2", "Q15", "Q16") if c in df.columns]
+        f1, f2, f3 = st.columns((2, 1, 1))
+        shown = f1.multiselect("Colonnes", list(df.columns), default=default_cols)
+        sort_by = f2.selectbox("Trier par", ["(aucun)"] + (shown or list(df.columns)))
+        ascending = f3.radio("Ordre", ("Croissant", "Décroissant"), horizontal=True) == "Croissant"
+        f4, f5, f6 = st.columns((2, 1, 1))
+        query = f4.text_input("Rechercher dans les colonnes affichées")
+        page_size = f5.selectbox("Lignes par page", (25, 50, 100, 250), index=1)
+        page_num = f6.number_input("Page", min_value=1, value=1, step=1)
+        with prof.stage("pagination"):
+            page, n_rows, n_pages = paginate(df, shown, None if sort_by == "(aucun)" else sort_by,
+                                             ascending, query, int(page_num), page_size)
+        st.caption(f"{n_rows} réponses – page {min(int(page_num), n_pages)}/{n_pages}")
+        st.dataframe(page, use_container_width=True)
+
+    counts = df["disposition"].value_counts().pipe(lambda s: s[s > 0]).rename_axis("disp").reset_index(name="count")
+    fig = px.pie(counts, names="disp", values="count", hole=0.35, color_discrete_sequence=px.colors.qualitative.Pastel)
+    fig.update_traces(textinfo="label+value+percent", textposition="outside")
+    fig.update_layout(margin=dict(t=40, b=10, l=10, r=10), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5))
+    plot(fig)
+
+    st.markdown("---")
+    if st.toggle("💬 Rechercher dans les verbatims"):
+        verbatim_search(signature, data, selected)
+
@@ -0,0 +1,139 @@
+"""Banc de performance : chaque étape mesurée séparément sur des exports synthétiques.
+
+    python -m benchmarks.bench                       # compare aux références enregistrées
+    python -m benchmarks.bench --lignes 10000 1000000
+    python -m benchmarks.bench --enregistrer         # met à jour benchmarks/baselines.json
+
+Étapes : parse (lecture du CSV), clean (tri par date + index), classify, aggregate (cube),
+filter (200 sélections de période), figures (indicateurs + graphiques de toutes les
+sections), stream (cube par blocs). Pour chacune : durée et pic mémoire (tracemalloc).
+Code de sortie 1 si une étape régresse au-delà de la tolérance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from amv.classification import classify
+from amv.cube import build_cube
+from amv.date_index import DateIndex, sort_by_date
+from amv.figures import SECTION_CHARTS, fig_repartition
+from amv.ingestion import inspect_export, read_export, stream_cube
+from amv.kpi import SECTIONS
+from amv.synth import GENERATOR_VERSION, write_export
+
+HERE = Path(__file__).resolve().parent
+DATA_DIR = HERE / ".donnees"
+BASELINES = HERE / "baselines.json"
+DEFAULT_ROWS = (10_000, 100_000)
+# En dessous de ce seuil (secondes), un écart relève du bruit de mesure.
+MIN_DELTA_S = 0.05
+
+
+def _measure(fn):
+    # Deux passes : tracemalloc ralentit fortement l'exécution, la durée est donc prise
+    # sur la seconde passe, non tracée (qui profite aussi des imports et caches chauds).
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - t0
+    return result, {"s": round(seconds, 4), "peak_mb": round(peak / 2**20, 2)}
+
+
+def _filters(dates: np.ndarray, n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        a, b = np.sort(rng.choice(dates, 2))
+        yield a.item(), b.item()
+
+
+def synthetic_export(n_rows: int) -> Path:
+    """Export synthétique en cache, régénéré quand la version du générateur change."""
+    path = DATA_DIR / f"synth_{n_rows}_v{GENERATOR_VERSION}.csv"
+    if not path.exists():
+        for stale in DATA_DIR.glob(f"synth_{n_rows}[._]*csv"):
+            stale.unlink()
+        write_export(path, n_rows)
+    return path
+
+
+def run(n_rows: int) -> dict:
+    """Mesure toutes les étapes sur un export synthétique de ``n_rows`` lignes."""
+    path = synthetic_export(n_rows)
+    stages = {}
+    df, stages["parse"] = _measure(lambda: read_export(path, inspect_export(path)["encoding"]))
+    (df, index), stages["clean"] = _measure(lambda: (lambda d: (d, DateIndex.build(d)))(sort_by_date(df)))
+    df, stages["classify"] = _measure(lambda: classify(df))
+    cube, stages["aggregate"] = _measure(lambda: build_cube(df))
+
+    def filter_all():
+        for start, end in _filters(index.dates, 200):
+            df.iloc[index.select(start, end)]
+            cube.select(start, end, None, [1])
+    _, stages["filter"] = _measure(filter_all)
+
+    def figures():
+        start, end = cube.days[0].item(), cube.days[-1].item()
+        n_comp, tallies = cube.select(start, end, None, [1])
+        for section, charts in SECTION_CHARTS.items():
+            ind = SECTIONS[section](n_comp, tallies)
+            for build in charts.values():
+                build(ind, None) if build is fig_repartition else build(ind)
+    figures()  # chargement paresseux de plotly hors mesure
+    _, stages["figures"] = _measure(figures)
+    _, stages["stream"] = _measure(lambda: stream_cube(path))
+    return stages
+
+
+def compare(results: dict, baselines: dict, tolerance: float) -> list[str]:
+    """Étapes plus lentes ou plus gourmandes que la référence (au-delà de la tolérance)."""
+    regressions = []
+    for rows, stages in results.items():
+        for stage, m in stages.items():
+            ref = baselines.get(rows, {}).get(stage)
+            if ref is None:
+                continue
+            if m["s"] > ref["s"] * (1 + tolerance) and m["s"] - ref["s"] > MIN_DELTA_S:
+                regressions.append(f"{rows} lignes / {stage} : {m['s']:.3f} s (référence {ref['s']:.3f} s)")
+            if m["peak_mb"] > ref["peak_mb"] * (1 + tolerance) and m["peak_mb"] - ref["peak_mb"] > 1:
+                regressions.append(f"{rows} lignes / {stage} : {m['peak_mb']:.1f} Mo "
+                                   f"(référence {ref['peak_mb']:.1f} Mo)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--lignes", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--enregistrer", action="store_true", help="enregistrer les mesures comme références")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="écart relatif toléré (0.5 = +50 %%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for n in args.lignes:
+        results[str(n)] = run(n)
+        for stage, m in results[str(n)].items():
+            print(f"{n:>9} lignes  {stage:<10} {m['s']:>8.3f} s  {m['peak_mb']:>8.1f} Mo")
+
+    baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    if args.enregistrer:
+        BASELINES.write_text(json.dumps({**baselines, **results}, indent=1, sort_keys=True) + "\n")
+        print(f"Références enregistrées dans {BASELINES.relative_to(HERE.parent)}")
+        return 0
+    regressions = compare(results, baselines, args.tolerance)
+    for r in regressions:
+        print("RÉGRESSION", r)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Vérifie que le cube lu par blocs est identique au cube construit en mémoire.
+
+    python -m benchmarks.check_stream                          # export synthétique
+    python -m benchmarks.check_stream Donnee/1_raw/*.csv --blocs 77 500
+
+Pour chaque export et chaque taille de bloc, ``stream_cube(path, k)`` est comparé à
+``build_cube(classify(read_export(path, ...)))`` : axes, cases et effectifs.
+Code de sortie 1 au premier écart constaté.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from amv.classification import classify
+from amv.cube import Cube, build_cube
+from amv.ingestion import inspect_export, read_export, stream_cube
+
+from benchmarks.bench import synthetic_export
+
+DEFAULT_ROWS = 10_000
+# Tailles volontairement non multiples : blocs partiels, fusions intermédiaires (8 blocs)
+# et bloc unique couvrant tout l'export.
+DEFAULT_CHUNKS = (77, 1_000, 4_096, 1_000_000)
+
+
+def differences(a: Cube, b: Cube) -> list[str]:
+    """Écarts entre deux cubes (liste vide s'ils sont identiques)."""
+    diffs = []
+    if not np.array_equal(a.days, b.days):
+        diffs.append(f"jours : {len(a.days)} contre {len(b.days)}")
+    if len(a.typepc) != len(b.typepc) or not all(
+            x == y or (pd.isna(x) and pd.isna(y)) for x, y in zip(a.typepc, b.typepc)):
+        diffs.append(f"TYPEPC : {a.typepc} contre {b.typepc}")
+    if a.dispositions != b.dispositions:
+        diffs.append(f"dispositions : {a.dispositions} contre {b.dispositions}")
+    if a.slots != b.slots:
+        diffs.append("questions : cases différentes")
+    if not diffs and not np.array_equal(a.counts, b.counts):
+        diffs.append(f"effectifs : {int((a.counts != b.counts).sum())} cellules différentes")
+    return diffs
+
+
+def check(path: Path, chunk_sizes) -> list[str]:
+    expected = build_cube(classify(read_export(path, inspect_export(path)["encoding"])))
+    failures = []
+    for k in chunk_sizes:
+        diffs = differences(stream_cube(path, k), expected)
+        print(f"{path.name}  blocs de {k:>9}  {'écart' if diffs else 'identique'}")
+        failures += [f"{path.name} / {k} : {d}" for d in diffs]
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.check_stream",
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument("exports", type=Path, nargs="*", help="exports CSV (défaut : export synthétique)")
+    parser.add_argument("--lignes", type=int, default=DEFAULT_ROWS, help="taille de l'export synthétique")
+    parser.add_argument("--blocs", type=int, nargs="+", default=list(DEFAULT_CHUNKS))
+    args = parser.parse_args(argv)
+
+    paths = args.exports
+    if not paths:
+        paths = [synthetic_export(args.lignes)]
+    failures = [f for path in paths for f in check(path, args.blocs)]
+    for f in failures:
+        print("ÉCART", f)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Filtre de période par index trié, comparé au masque équivalent."""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amv.date_index import DateIndex, sort_by_date
+from amv.schema import DATE_COL, DISPO_COL
+from amv.synth import generate
+
+
+@pytest.fixture(scope="module")
+def data():
+    df = generate(2000, seed=3, months=3)
+    df = pd.DataFrame({DATE_COL: pd.to_datetime(df[DATE_COL], format="%Y%m%d", errors="coerce"),
+                       DISPO_COL: df[DISPO_COL].astype(int).astype("Int8")})
+    df = sort_by_date(df)
+    return df, DateIndex.build(df)
+
+
+def _expected(df, start, end, code=None):
+    day = df[DATE_COL].dt.date
+    # Période, plus les interrompus (code 0) quelle que soit leur date.
+    mask = ((day >= start) & (day <= end) & df[DATE_COL].notna()) | df[DISPO_COL].eq(0)
+    if code is not None:
+        mask &= df[DISPO_COL].eq(code)
+    return np.flatnonzero(mask.to_numpy(bool, na_value=False))
+
+
+def test_full_period_is_a_single_slice(data):
+    df, index = data
+    start, end = index.bounds()
+    selected = index.select(start, end)
+    assert isinstance(selected, slice)
+    assert np.array_equal(np.arange(len(df))[selected], _expected(df, start, end))
+
+
+@pytest.mark.parametrize("code", [None, 0, 1, 2])
+def test_select_matches_mask(data, code):
+    df, index = data
+    lo, hi = index.bounds()
+    for start, end in [(lo, hi), (lo + dt.timedelta(days=20), hi - dt.timedelta(days=15)),
+                       (lo, lo + dt.timedelta(days=10)), (hi, hi)]:
+        got = np.arange(len(df))[index.select(start, end, code)]
+        assert np.array_equal(got, _expected(df, start, end, code)), (start, end, code)
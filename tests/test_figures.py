@@ -0,0 +1,28 @@
+"""Graphiques du Dashboard : chaque graphique filtrable doit pouvoir remonter une sélection."""
+
+import pytest
+
+from amv.classification import classify
+from amv.cube import build_cube
+from amv.figures import CHART_QUESTIONS, REPARTITION_NPS, REPARTITION_Q1, SECTION_CHARTS, fig_repartition
+from amv.kpi import SECTIONS
+from amv.schema import apply_schema
+from amv.synth import generate
+
+
+@pytest.fixture(scope="module")
+def cube():
+    return build_cube(classify(apply_schema(generate(3000, seed=5))))
+
+
+@pytest.mark.parametrize("section", list(SECTION_CHARTS))
+def test_cross_filter_charts_are_selectable(cube, section):
+    start, end = cube.days[0].item(), cube.days[-1].item()
+    ind = SECTIONS[section](*cube.select(start, end, None, [1]))
+    for cid, build in SECTION_CHARTS[section].items():
+        figs = [build(ind, c) for c in (REPARTITION_Q1, REPARTITION_NPS)] if build is fig_repartition else [build(ind)]
+        for fig in figs:
+            # Streamlit n'écoute que « plotly_selected », que les camemberts n'émettent pas.
+            assert {t.type for t in fig.data} == {"bar"}, (section, cid)
+        if cid != "repartition":
+            assert cid in CHART_QUESTIONS
@@ -0,0 +1,35 @@
+"""Indicateurs par section et aides de calcul partagées."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amv.classification import codes_for, modalities
+from amv.kpi import SECTIONS, pct, ratio
+
+
+def _tallies(fill=0):
+    return {q: pd.Series(fill, index=pd.Index(modalities(q), name=q)) for q in
+            ("Q1", "Q3", "Q5", "Q6", "Q7", "Q8", "Q9", "Q11", "Q13", "Q15", "Q16")}
+
+
+def test_pct_and_ratio_guard_empty_totals():
+    assert pct(1, 3) == 33.3 and pct(5, 0) == 0.0
+    assert pct(1, 3, None) == pytest.approx(100 / 3)
+    assert np.allclose(ratio(np.array([1, 2]), np.array([4, 0]), 100), [25, np.nan], equal_nan=True)
+
+
+def test_sections_on_an_empty_selection():
+    for section in SECTIONS.values():
+        ind = section(0, _tallies())
+        assert all(not isinstance(v, float) or v == 0.0 for v in ind.values())
+
+
+def test_nps_and_shares_by_label():
+    tallies = _tallies()
+    tallies["Q16"][[10, 9, 8, 0]] = [3, 1, 2, 2]
+    tallies["Q3"][["Très complètes", "Nul"]] = [3, 1]
+    ind = SECTIONS["global"](8, tallies)
+    assert ind["nps_score"] == 25.0
+    assert SECTIONS["souscription"](4, tallies)["pct_suff_compl"] == 75.0
+    assert codes_for("Q15", ("Simples", "Compliquées")) == [1, 3]
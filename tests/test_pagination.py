@@ -0,0 +1,36 @@
+"""Pagination du détail des réponses : filtre texte, tri et découpage."""
+
+import pandas as pd
+import pytest
+
+from amv.pagination import paginate
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-16", None, "2025-02-03", None]),
+        "note": pd.array([9, None, 3, 10], dtype="Int8"),
+        "texte": ["Natation", None, "nan", "Rien"],
+        "marque": pd.Categorical(["APPLE", None, "SAMSUNG", "apple"]),
+    })
+
+
+@pytest.mark.parametrize("query", ["nat", "na", "nan", "<NA>", "None"])
+def test_missing_values_never_match(df, query):
+    page, n_rows, _ = paginate(df, ["date", "note"], query=query)
+    assert n_rows == 0 and page.empty
+
+
+def test_query_matches_text_dates_numbers_and_categories(df):
+    assert paginate(df, ["texte"], query="nat")[1] == 1      # « Natation », pas la valeur manquante
+    assert paginate(df, ["texte"], query="nan")[1] == 1      # le texte « nan » lui-même
+    assert paginate(df, ["date"], query="2025-02")[1] == 1
+    assert paginate(df, ["note"], query="10")[1] == 1
+    assert paginate(df, ["marque"], query="apple")[1] == 2
+
+
+def test_sort_and_pages(df):
+    page, n_rows, n_pages = paginate(df, ["note"], sort_by="note", ascending=False, page=2, page_size=3)
+    assert (n_rows, n_pages) == (4, 2)
+    assert page["note"].isna().all()  # manquants en dernier
@@ -0,0 +1,24 @@
+"""Ligne de commande du moteur KPI."""
+
+import pandas as pd
+import pytest
+
+from amv.report import main
+from amv.synth import write_export
+
+
+def test_unsupported_output_is_rejected_before_any_work(tmp_path, capsys):
+    store = tmp_path / "store"
+    with pytest.raises(SystemExit) as exc:
+        main([str(tmp_path / "kpi.xlsx"), "--raw", str(tmp_path / "absent"), "--store", str(store)])
+    assert exc.value.code == 2
+    assert "format de sortie non géré : .xlsx" in capsys.readouterr().err
+    assert not store.exists()
+
+
+def test_grid_is_written_from_streamed_exports(tmp_path):
+    write_export(tmp_path / "raw" / "export.csv", 500)
+    out = tmp_path / "kpi.csv"
+    assert main([str(out), "--raw", str(tmp_path / "raw"), "--flux", "--bloc", "77"]) == 0
+    grid = pd.read_csv(out, sep=";", encoding="utf-8-sig")
+    assert grid.loc[grid["TYPEPC"] == "Tous", "reponses"].sum() == grid.loc[grid["TYPEPC"] != "Tous", "reponses"].sum()
@@ -0,0 +1,111 @@
+"""Règles de priorité de l'historique : dédoublonnage, ordre des exports, partitions."""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from amv.schema import DATE_COL, SOLICIT_COL
+from amv.store import NO_DATE, export_order, load_store, update_store
+from amv.synth import ENCODING, write_export
+
+
+def _export(raw, name, n_rows, start, seed=0, mtime=None):
+    path = write_export(raw / name, n_rows, seed=seed, start=start, months=2)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def _partitions(store):
+    return {p.name: pd.read_parquet(p) for p in sorted((store / "partitions").glob("*.parquet"))}
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    raw, store = tmp_path / "raw", tmp_path / "store"
+    raw.mkdir()
+    return raw, store
+
+
+def test_newer_export_replaces_shared_rows(dirs):
+    raw, store = dirs
+    _export(raw, "a.csv", 300, "2025-01-01")
+    _export(raw, "b.csv", 200, "2025-06-01", seed=1)
+    assert update_store(raw, store) == ["a.csv", "b.csv"]
+
+    df = load_store(store)
+    assert len(df) == 300 and df["IDdefiche"].is_unique
+    shared = df[df["IDdefiche"] <= 200]
+    assert shared[SOLICIT_COL].min() >= pd.Timestamp("2025-04-01")  # lignes de b
+    assert df.loc[df["IDdefiche"] > 200, SOLICIT_COL].max() < pd.Timestamp("2025-03-01")  # lignes de a
+
+
+def test_older_export_ingested_later_does_not_win(dirs):
+    raw, store = dirs
+    _export(raw, "b.csv", 200, "2025-06-01", seed=1)
+    update_store(raw, store)
+    before = load_store(store).set_index("IDdefiche").sort_index()
+
+    # Fichier plus ancien par ses données, mais copié après (mtime plus récent).
+    _export(raw, "a.csv", 300, "2025-01-01", mtime=4 * 10**18)
+    assert update_store(raw, store) == ["a.csv"]
+
+    after = load_store(store).set_index("IDdefiche").sort_index()
+    assert len(after) == 300
+    pd.testing.assert_frame_equal(after.loc[before.index], before, check_like=True, check_categorical=False)
+
+
+def test_order_comes_from_data_not_mtime(dirs):
+    raw, store = dirs
+    # Même mtime pour les deux (clone, déploiement) et noms dans l'ordre inverse des données.
+    new = _export(raw, "1_recent.csv", 200, "2025-06-01", seed=1, mtime=10**18)
+    old = _export(raw, "2_ancien.csv", 200, "2025-01-01", mtime=10**18)
+    update_store(raw, store)
+
+    df = load_store(store)
+    assert len(df) == 200
+    assert df[SOLICIT_COL].min() >= pd.Timestamp("2025-04-01")
+    exports = json.loads((store / "manifest.json").read_text())["exports"]
+    orders = {name: e["ordre"] for name, e in exports.items()}
+    assert orders[new.name] > orders[old.name]
+
+
+def test_replaced_rows_leave_their_old_partition(dirs):
+    raw, store = dirs
+    _export(raw, "a.csv", 300, "2025-01-01")
+    update_store(raw, store)
+    _export(raw, "b.csv", 200, "2025-06-01", seed=1)
+    update_store(raw, store)
+
+    parts = _partitions(store)
+    ids = pd.concat(parts.values())["IDdefiche"]
+    assert ids.is_unique and len(ids) == 300
+    for name, part in parts.items():
+        month = name.removeprefix("mois=").removesuffix(".parquet")
+        assert month != NO_DATE
+        assert (part[SOLICIT_COL].dt.strftime("%Y-%m") == month).all()
+        if month < "2025-04":
+            assert (part["IDdefiche"] > 200).all()
+
+
+def test_duplicate_ids_within_an_export_keep_the_last(dirs):
+    raw, store = dirs
+    path = _export(raw, "a.csv", 50, "2025-01-01")
+    lines = path.read_text(encoding=ENCODING).splitlines(keepends=True)
+    # La ligne 1 réapparaît en fin de fichier avec un autre TYPEPC.
+    last = lines[1].replace('"Réparation"', '"Remplacement"') if '"Réparation"' in lines[1] \
+        else lines[1].replace('"Remplacement"', '"Réparation"')
+    path.write_text("".join(lines) + last, encoding=ENCODING)
+    update_store(raw, store)
+
+    df = load_store(store)
+    assert len(df) == 50
+    assert str(df.loc[df["IDdefiche"] == 1, "TYPEPC"].iloc[0]) in last
+
+
+def test_export_order_uses_latest_date():
+    df = pd.DataFrame({DATE_COL: pd.to_datetime(["2025-01-10", None]),
+                       SOLICIT_COL: pd.to_datetime(["2025-01-01", "2025-02-01"])})
+    assert export_order(df) == pd.Timestamp("2025-02-01").value
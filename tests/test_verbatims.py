@@ -0,0 +1,39 @@
+"""Recherche dans les verbatims : index inversé et tableau mois × TYPEPC."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amv.schema import DATE_COL, TYPEPC_COL
+from amv.verbatims import VerbatimIndex, hits_by_month
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        DATE_COL: pd.to_datetime(["2025-01-05", "2025-01-20", "2025-02-03", None]),
+        TYPEPC_COL: pd.Categorical(['"Réparation"', '"Remplacement"', '"Réparation"', None]),
+        # La réponse 0 parle du téléphone dans deux commentaires.
+        "Q2": ["Téléphone réparé vite", "Très bien", None, "Le téléphone est arrivé"],
+        "O_Q10": [None, None, "rien à signaler", None],
+        "Q12": ["Reçu un téléphone neuf", "", "Réparation longue", None],
+    })
+
+
+def test_response_matching_in_two_columns_counts_once(df):
+    index = VerbatimIndex.build(df)
+    docs = index.search("téléphone")
+    rows = index.rows[docs]
+    assert len(docs) == 3 and sorted(rows.tolist()) == [0, 0, 3]
+
+    table = hits_by_month(df, rows)
+    assert table.loc["Total", "Total"] == 2
+    assert table.loc["2025-01", '"Réparation"'] == 1
+    assert table.loc["Sans date", "Non renseigné"] == 1
+
+
+def test_prefix_and_phrase_queries(df):
+    index = VerbatimIndex.build(df)
+    assert np.unique(index.rows[index.search("répar*")]).tolist() == [0, 2]
+    assert index.rows[index.search('"téléphone neuf"')].tolist() == [0]
+    assert len(index.search("batterie")) == 0